@@ -29,6 +29,9 @@
         'base','product',
     ],
     'data': [
+       'security/ir.model.access.csv',
+       'data/ir_cron.xml',
+       'data/product_actions.xml',
        'views/settings_view.xml',
        'views/product_view.xml',
     ],
@@ -21,6 +21,9 @@ from splashpy import Framework
 class OdooClient(ClientInfo):
     """Define General Information about this Splash Client"""
 
+    # Per Worker Cache of Client Icons
+    __icons__ = None
+
     def __init__(self):
         pass
 
@@ -41,25 +44,32 @@ class OdooClient(ClientInfo):
         self.long_desc = "Splash Client for connecting Odoo Erp Systems"
         try:
             # ====================================================================#
-            # Load Odoo Company Object
-            company = http.request.env['res.company']._get_main_company().read([])
+            # Load Odoo Company Profile
+            from odoo.addons.splashsync.helpers import CompanyHelper
+            company = CompanyHelper.get_profile()
             # ====================================================================#
             # Company Information
-            self.company = company[0]["name"]
-            self.address = company[0]["street"]
-            self.zip = company[0]["zip"]
-            self.town = company[0]["city"]
-            self.country = company[0]["phone"]
-            self.www = company[0]["website"]
-            self.email = company[0]["email"]
-            self.phone = company[0]["phone"]
+            self.company = company["name"]
+            self.address = company["street"]
+            self.zip = company["zip"]
+            self.town = company["city"]
+            self.country = company["country"]
+            self.www = company["website"]
+            self.email = company["email"]
+            self.phone = company["phone"]
         except:
             self.company = "Unable to fetch Main Company"
 
     def loadOdooIcons(self):
         """Change Client Server Icons"""
-        from splashpy.componants.files import Files
-        import os
-        assets_path = os.path.dirname(os.path.realpath(__file__))+"/static/assets/img"
-        self.ico_raw = Files.getRawContents(assets_path + "/icon.png")
-        self.logo_raw = Files.getRawContents(assets_path + "/logo.png")
+        # ====================================================================#
+        # Load Icons from Disk Only Once per Worker
+        if OdooClient.__icons__ is None:
+            from splashpy.componants.files import Files
+            import os
+            assets_path = os.path.dirname(os.path.realpath(__file__))+"/static/assets/img"
+            OdooClient.__icons__ = (
+                Files.getRawContents(assets_path + "/icon.png"),
+                Files.getRawContents(assets_path + "/logo.png"),
+            )
+        self.ico_raw, self.logo_raw = OdooClient.__icons__
@@ -12,22 +12,30 @@
 #  file that was distributed with this source code.
 #
 
+import hashlib
+import json
 from odoo import http
 from splashpy import Framework
 from splashpy.server import SplashServer
 from splashpy.templates.widgets import Basic
 from odoo.addons.splashsync.client import OdooClient
 from odoo.addons.splashsync.objects import ThirdParty, Product
-from odoo.addons.splashsync.helpers import SettingsManager
+from odoo.addons.splashsync.helpers import FrameworkHelper, SettingsManager
 
 class Webservice(http.Controller):
 
+    # Per Worker Splash Servers, by Database, Company & Settings
+    __servers__ = {}
+
     @http.route('/splash', type='http', auth='splash', website=False, csrf=False)
     def splash(self, **kw):
         """
          Respond to Splash Webservice Requests
          """
-        return self.get_server().fromWerkzeug(http.request.httprequest)
+        with FrameworkHelper.lock:
+            splash_server = self.get_server()
+
+        return splash_server.fromWerkzeug(http.request.httprequest)
 
     # @http.route('/splash/debug', type='http', auth='public', website=True)
     @http.route('/splash/debug', type='http', auth='user', website=True)
@@ -38,7 +46,8 @@ class Webservice(http.Controller):
         from splashpy.client import SplashClient
         # ====================================================================#
         # Init Splash Framework
-        self.get_server()
+        with FrameworkHelper.lock:
+            self.get_server()
         # ====================================================================#
         # Load Server Info
         wsId, wsKey, wsHost = Framework.config().identifiers()
@@ -60,26 +69,87 @@ class Webservice(http.Controller):
 
     @staticmethod
     def get_server():
-        """Build Splash Server"""
+        """Get Splash Server, Reused if Already Built by this Worker"""
         # ====================================================================#
         # Init Odoo User & Company
         SettingsManager.ensure_company()
         # ====================================================================#
+        # Server Already Built for this Database, Company & Settings
+        key = Webservice.get_server_key()
+        if key in Webservice.__servers__:
+            return Webservice.bind_server(Webservice.__servers__[key])
+        # ====================================================================#
         # Build Splash Server with Common Options
         splash_objects = [
             # ThirdParty(),
             Product(),
         ]
+        splash_widgets = [Basic()]
+        splash_client = OdooClient()
         splash_server = SplashServer(
             SettingsManager.get_id(),
             SettingsManager.get_key(),
             splash_objects,
-            [Basic()],
-            OdooClient()
+            splash_widgets,
+            splash_client
         )
         # ====================================================================#
         # Force Ws Host if Needed
         if SettingsManager.is_expert():
             Framework.config().force_host(SettingsManager.get_host())
+        # ====================================================================#
+        # Store Server for Next Requests
+        Webservice.__servers__[key] = {
+            "server": splash_server,
+            "objects": splash_objects,
+            "widgets": splash_widgets,
+            "client": splash_client,
+            "config": Framework.config(),
+        }
+
+        return splash_server
+
+    @staticmethod
+    def bind_server(registered):
+        """
+        Rebind a Stored Splash Server to Current Request
+
+        Framework globals (config, logger, objects...) are shared by all
+        servers of a worker, so they are restored from stored instances
+        and Objects forget previous request environment.
+
+        :param registered: dict
+        :return: SplashServer
+        """
+        splash_server = registered["server"]
+        splash_server.__init__(
+            SettingsManager.get_id(),
+            SettingsManager.get_key(),
+            registered["objects"],
+            registered["widgets"],
+            registered["client"],
+            False,
+            registered["config"]
+        )
+        for splash_object in registered["objects"]:
+            splash_object.reset()
 
         return splash_server
+
+    @staticmethod
+    def get_server_key():
+        """
+        Build Server Registry Key from Database, Company & Settings
+        :return: tuple
+        """
+        settings = json.dumps(SettingsManager.get_configuration(), sort_keys=True, default=str)
+        return (
+            http.request.env.cr.dbname,
+            SettingsManager.get_company_id(),
+            hashlib.md5(settings.encode()).hexdigest()
+        )
+
+    @staticmethod
+    def reset():
+        """Forget all Splash Servers Built by this Worker"""
+        Webservice.__servers__ = {}
@@ -14,3 +14,4 @@
 
 from .objects import *
 from .settings import SettingsManager
+from .framework import FrameworkHelper
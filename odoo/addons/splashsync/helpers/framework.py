@@ -0,0 +1,140 @@
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+
+import logging
+import threading
+from contextlib import contextmanager
+from splashpy import const
+
+
+class FrameworkHelper:
+    """
+    Use Splash Outside of Http Requests (i.e: Scheduled Actions)
+
+    Splash Framework configuration, logger & objects are shared by a whole
+    worker, and used by webservice requests. Scheduled actions never change
+    them: Splash settings are booted for current thread only, and requests
+    are sent to Splash server with a connection built from these settings.
+    """
+
+    # Splash Framework Binding Lock, Only Held by Webservice while Binding its Server
+    lock = threading.RLock()
+
+    @staticmethod
+    @contextmanager
+    def boot(env, company_id):
+        """
+        Boot Splash Settings of a Company for Current Thread, Reset on Exit
+        :param env: Odoo Environment
+        :param company_id: int
+        :return: dict   Splash Server Connection
+        """
+        from odoo.addons.splashsync.helpers import SettingsManager
+        SettingsManager.boot(env, company_id)
+        try:
+            yield FrameworkHelper.get_connection()
+        finally:
+            SettingsManager.reset()
+
+    # ====================================================================#
+    # Splash Server Requests
+    # ====================================================================#
+
+    @staticmethod
+    def get_connection():
+        """
+        Get Splash Server Connection from Settings of Current Thread
+
+        Values are resolved in calling thread, so that requests can be sent
+        from any thread, whatever Splash Framework configuration is.
+
+        :return: dict
+        """
+        from odoo.addons.splashsync.helpers import SettingsManager
+        return {
+            "id": SettingsManager.get_id(),
+            "key": SettingsManager.get_key(),
+            "host": SettingsManager.get_host() if SettingsManager.is_expert() else const.__HOST__,
+        }
+
+    @staticmethod
+    def send(connection, service, request):
+        """
+        Send a Request to Splash Server with a Given Connection
+
+        Messages are encoded & decoded with connection values only, neither
+        Splash Framework configuration nor logger are used.
+
+        :param connection: dict     Splash Server Connection
+        :param service: str         Splash Soap Service (Objects, Files...)
+        :param request: dict        Splash Request Contents
+        :return: False, dict
+        """
+        from splashpy.componants.encoder import AESCipher, XmlManager
+        from splashpy.soap.client import SoapClient, SoapFault
+        cipher = AESCipher(connection["key"], connection["id"])
+        request = dict(request, debug=0, verbose=0, log={"msg": {}, "war": {}, "err": {}, "deb": {}})
+        try:
+            soap_client = SoapClient(
+                location=connection["host"], ns=False, exceptions=True, soap_server="jetty",
+                http_headers={'Content-type': 'application/x-www-form-urlencoded'}
+            )
+            soap_response = getattr(soap_client, service)(
+                id=connection["id"], data=cipher.encrypt(XmlManager.to_xml(request))
+            )
+            response = XmlManager.to_object(cipher.decrypt(soap_response.children().children().children().__str__()))
+        except SoapFault as fault:
+            logging.getLogger("SPLASH SYNC").warning("Splash " + service + " Request Failed: " + fault.faultstring)
+            return False
+        except Exception as exception:
+            logging.getLogger("SPLASH SYNC").warning("Splash " + service + " Request Failed: " + str(exception))
+            return False
+        # ====================================================================#
+        # Forward Splash Server Errors to Odoo Logs
+        if isinstance(response, dict) and isinstance(response.get("log"), dict):
+            for message in (response["log"].get("err") or {}).values():
+                logging.getLogger("SPLASH SYNC").warning("Splash Server: " + str(message))
+
+        return response
+
+    @staticmethod
+    def commit(connection, object_type, object_ids, action, user, comment):
+        """
+        Commit Local Objects Changes to Splash Server with a Given Connection
+        :param connection: dict     Splash Server Connection
+        :param object_type: str
+        :param object_ids: list
+        :param action: str
+        :param user: str
+        :param comment: str
+        :return: bool
+        """
+        response = FrameworkHelper.send(connection, "Objects", {
+            "tasks": {
+                "task": {
+                    "id": 1,
+                    "name": const.__SPL_F_COMMIT__,
+                    "desc": "Commit changes from Python Module",
+                    "params": {
+                        "type": str(object_type),
+                        "id": [str(object_id) for object_id in object_ids],
+                        "action": str(action),
+                        "user": str(user),
+                        "comment": str(comment),
+                    },
+                }
+            }
+        })
+
+        return isinstance(response, dict) and response.get("result") == "1"
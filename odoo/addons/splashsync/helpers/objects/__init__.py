@@ -12,14 +12,20 @@
 #  file that was distributed with this source code.
 #
 
+from .caches import CacheManager
 from .config import ObjectConfigurator
 from .lists import ListsHelper
+from .schema import SchemaHelper
+from .dispatch import FieldsDispatcher
 from .basic import BasicFields
 from .files import OddoFilesHelper
+from .downloads import FilesDownloader
 from .binaries import BinaryFields
+from .company import CompanyHelper
 from .currency import CurrencyHelper
 from .taxes import TaxHelper
 from .trans import TransHelper
+from .writes import WritesBuffer
 from .relations import M2MHelper, M2OHelper
 
 from .products.attributes import AttributesHelper, ValuesHelper, LinesHelper
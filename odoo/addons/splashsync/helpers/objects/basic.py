@@ -39,18 +39,18 @@ class BasicFields():
             return OrderedDict(sorted(self.__BasicFields__.items()))
         # Init List Cache
         self.__BasicFields__ = {}
-        # Walk on Model Fields Definitions
-        for fieldId in self.getModel().fields_get():
-            # Get Fields Definitions
-            field = self.getModel().fields_get([fieldId])
-            # Filter Not Allowed Field
-            if fieldId in self.get_composite_fields():
-                continue
+        # Walk on Model Fields Definitions, Grouped by Types
+        from odoo.addons.splashsync.helpers import SchemaHelper
+        for field_type, fields in SchemaHelper.get_types(self.getModel()).items():
             # Filter on Basic Fields Types
-            if field[fieldId]["type"] not in self.__BasicTypes__.keys():
+            if field_type not in self.__BasicTypes__.keys():
                 continue
-            # Add Definition to Cache
-            self.__BasicFields__[fieldId] = field[fieldId]
+            for fieldId, field in fields.items():
+                # Filter Not Allowed Field
+                if fieldId in self.get_composite_fields():
+                    continue
+                # Add Definition to Cache
+                self.__BasicFields__[fieldId] = field
 
         return OrderedDict(sorted(self.__BasicFields__.items()))
 
@@ -33,18 +33,18 @@ class BinaryFields():
             return self.__BinaryFields__
         # Init List Cache
         self.__BinaryFields__ = {}
-        # Walk on Model Fields Definitions
-        for fieldId in self.getModel().fields_get():
-            # Get Fields Definitions
-            field = self.getModel().fields_get([fieldId])
-            # Filter Not Allowed Field
-            if fieldId in self.get_composite_fields():
-                continue
+        # Walk on Model Fields Definitions, Grouped by Types
+        from odoo.addons.splashsync.helpers import SchemaHelper
+        for field_type, fields in SchemaHelper.get_types(self.getModel()).items():
             # Filter on Binary Fields Types
-            if field[fieldId]["type"] not in self.__BinaryTypes__.keys():
+            if field_type not in self.__BinaryTypes__.keys():
                 continue
-            # Add Definition to Cache
-            self.__BinaryFields__[fieldId] = field[fieldId]
+            for fieldId, field in fields.items():
+                # Filter Not Allowed Field
+                if fieldId in self.get_composite_fields():
+                    continue
+                # Add Definition to Cache
+                self.__BinaryFields__[fieldId] = field
 
         return self.__BinaryFields__
 
@@ -72,20 +72,9 @@ class BinaryFields():
         # Fetch Field Definition
         field = self.__BinaryFields__[field_id]
         # ====================================================================#
-        # Fetch Binary raw Contents
-        base64_contents = getattr(self.object, field_id)
-        if not isinstance(base64_contents, bytes):
-            self._out[field_id] = None
-        else:
-            from odoo.addons.splashsync.helpers import OddoFilesHelper
-            self._out[field_id] = OddoFilesHelper.encode(
-                self.getDomain(),
-                self.object.id,
-                field["string"],
-                field_id,
-                field_id,
-                getattr(self.object, field_id)
-            )
+        # Encode Binary from Stored Metadata or Contents
+        from odoo.addons.splashsync.helpers import OddoFilesHelper
+        self._out[field_id] = OddoFilesHelper.encode_field(self.object, field_id, field["string"], field_id)
 
         self._in.__delitem__(index)
 
@@ -98,7 +87,12 @@ class BinaryFields():
 
         self.set_binary_data(field_id, field_data, self.object)
 
-    def set_binary_data(self, field_id, field_data, target):
+    def set_binary_data(self, field_id, field_data, target, position=0):
+        from odoo.addons.splashsync.helpers import FilesDownloader, OddoFilesHelper
+        # ====================================================================#
+        # Deferred Mode => Forget Previously Queued File
+        if self.is_deferred_binary(field_id):
+            OddoFilesHelper.getQueueModel().cancel(target, field_id)
         # ====================================================================#
         # Empty Value Received
         if not isinstance(field_data, dict) or field_data is None:
@@ -107,21 +101,41 @@ class BinaryFields():
             return
         # ====================================================================#
         # Compare Md5
-        if field_data['md5'] == FilesHelper.md5(getattr(target, field_id), True):
+        if field_data['md5'] == OddoFilesHelper.get_md5(target, field_id):
+            self._in.__delitem__(field_id)
+
+            return
+        # ====================================================================#
+        # Read File from Local Contents
+        new_file = OddoFilesHelper.get_local_file(field_data['md5'])
+        # ====================================================================#
+        # Deferred Mode => Queue File for Background Download
+        if new_file is None and self.is_deferred_binary(field_id):
+            from odoo.addons.splashsync.helpers import SettingsManager
+            OddoFilesHelper.getQueueModel().enqueue(
+                target, field_id, field_data, position, SettingsManager.get_company_id()
+            )
             self._in.__delitem__(field_id)
 
             return
         # ====================================================================#
         # Read File from Server
-        new_file = Files.getFile(
-            field_data['file'] if not Framework.isDebugMode() else field_data['path'],
-            field_data['md5']
-        )
+        if new_file is None:
+            new_file = FilesDownloader.get(field_data)
         if isinstance(new_file, dict) and "raw" in new_file:
             self.setSimple(field_id, new_file["raw"], target)
+            OddoFilesHelper.getIndexModel().update_metadata(target, field_id, new_file["raw"])
         else:
             Framework.log().error("Unable to read file from Server")
 
+    def is_deferred_binary(self, field_id):
+        """
+        Check if Binary Field Files are Downloaded in Background
+        :param field_id: str
+        :return: bool
+        """
+        return False
+
     def getFile(self, path, md5):
         """
         Custom Reading of a File from Local System (Database or any else)
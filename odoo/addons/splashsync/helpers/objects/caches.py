@@ -0,0 +1,107 @@
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+
+import weakref
+
+
+class CacheManager:
+    """
+    Versions of Odoo Models Data used by Splash Per Worker Caches
+
+    Per worker caches are keyed on versions of the models they were built
+    from. A model version is its records count, last id & last write date,
+    read once per transaction: changes committed by any worker give a new
+    version, while versions seen in a transaction are forgotten on commit
+    or rollback, so that data written by a rolled back transaction are
+    never read from caches afterwards.
+    """
+
+    # Caches of Current Transactions, by Cursor: name => dict
+    __transactions__ = weakref.WeakKeyDictionary()
+
+    # ====================================================================#
+    # Models Versions
+    # ====================================================================#
+
+    @staticmethod
+    def get_version(env, domains):
+        """
+        Get Current Version of Odoo Models Data
+        :param env: Odoo Environment
+        :param domains: list    Odoo Models Names
+        :return: tuple
+        """
+        versions = CacheManager.get_transaction_cache(env.cr, "versions")
+        for domain in domains:
+            if domain in versions:
+                continue
+            if domain not in env:
+                versions[domain] = None
+                continue
+            env.cr.execute("SELECT count(id), max(id), max(write_date) FROM " + env[domain]._table)
+            versions[domain] = tuple(str(value) for value in env.cr.fetchone())
+
+        return tuple(versions[domain] for domain in domains)
+
+    @staticmethod
+    def notify(model):
+        """
+        Notify a Model was Changed in Current Transaction
+        :param model: Odoo Model
+        :return: void
+        """
+        CacheManager.get_transaction_cache(model.env.cr, "versions").pop(model._name, None)
+
+    # ====================================================================#
+    # Per Transaction Caches
+    # ====================================================================#
+
+    @staticmethod
+    def get_transaction_cache(cr, name):
+        """
+        Get a Cache Forgotten at Cursor Transaction End, on Commit or Rollback
+        :param cr: Odoo Cursor
+        :param name: str
+        :return: dict
+        """
+        if cr not in CacheManager.__transactions__:
+            CacheManager.__transactions__[cr] = {}
+            cr.after('commit', lambda: CacheManager.__transactions__.pop(cr, None))
+            cr.after('rollback', lambda: CacheManager.__transactions__.pop(cr, None))
+        if name not in CacheManager.__transactions__[cr]:
+            CacheManager.__transactions__[cr][name] = {}
+
+        return CacheManager.__transactions__[cr][name]
+
+    # ====================================================================#
+    # Per Worker Caches
+    # ====================================================================#
+
+    @staticmethod
+    def store(cache, key, value):
+        """
+        Store a Value in a Per Worker Cache & Drop its Outdated Versions
+
+        Cache keys are tuples with data version as last item.
+
+        :param cache: dict
+        :param key: tuple
+        :param value: mixed
+        :return: mixed
+        """
+        for outdated in [k for k in cache.keys() if k[0:-1] == key[0:-1]]:
+            del cache[outdated]
+        cache[key] = value
+
+        return value
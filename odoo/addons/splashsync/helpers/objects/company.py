@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+from odoo import http
+from .caches import CacheManager
+
+
+class CompanyHelper:
+    """Collection of Static Functions to access Odoo Main Company Profile"""
+
+    domain = "res.company"
+
+    # Company Fields Used by Splash
+    fields = ["name", "street", "zip", "city", "country_id", "website", "email", "phone", "currency_id"]
+
+    # Odoo Models Read to Build Profiles
+    domains = [domain, "res.currency"]
+
+    # Per Worker Cache of Companies Profiles, by Database, Company & Data Version
+    __profiles__ = {}
+
+    @staticmethod
+    def get_profile():
+        """
+        Get Main Company Profile
+
+        Only fields used by Splash are read, once per worker, then
+        profile is kept until a company, a currency or company partner
+        is changed. Partners are not versioned as a whole, company partner
+        write date is used instead.
+
+        :return: dict
+        """
+        env = http.request.env
+        company = env[CompanyHelper.domain].sudo()._get_main_company()
+        version = (CacheManager.get_version(env, CompanyHelper.domains), company.partner_id.write_date)
+        key = (env.cr.dbname, company.id, version)
+        if key in CompanyHelper.__profiles__:
+            return CompanyHelper.__profiles__[key]
+        # ====================================================================#
+        # Load Company Profile
+        data = company.read(CompanyHelper.fields)[0]
+        profile = {
+            "id": company.id,
+            "name": data["name"],
+            "street": data["street"],
+            "zip": data["zip"],
+            "city": data["city"],
+            "country": data["country_id"][1] if data["country_id"] else None,
+            "website": data["website"],
+            "email": data["email"],
+            "phone": data["phone"],
+            "currency_id": data["currency_id"][0] if data["currency_id"] else None,
+            "currency_code": data["currency_id"][1] if data["currency_id"] else None,
+        }
+
+        return CacheManager.store(CompanyHelper.__profiles__, key, profile)
@@ -14,6 +14,7 @@
 
 from odoo import http
 from splashpy import Framework
+from .company import CompanyHelper
 
 
 class CurrencyHelper:
@@ -24,16 +25,14 @@ class CurrencyHelper:
     @staticmethod
     def get_main_currency():
         try:
-            company = http.request.env['res.company']._get_main_company().read([])
-            return CurrencyHelper.load(company[0]["currency_id"][0])
+            return CurrencyHelper.load(CompanyHelper.get_profile()["currency_id"])
         except:
             return None
 
     @staticmethod
     def get_main_currency_code():
         try:
-            company = http.request.env['res.company']._get_main_company().read([])
-            return company[0]["currency_id"][1]
+            return CompanyHelper.get_profile()["currency_code"]
         except Exception as exception:
             Framework.log().fromException(exception)
             return None
@@ -41,8 +40,7 @@ class CurrencyHelper:
     @staticmethod
     def get_main_currency_id():
         try:
-            company = http.request.env['res.company']._get_main_company().read([])
-            return company[0]["currency_id"][0]
+            return CompanyHelper.get_profile()["currency_id"]
         except Exception as exception:
             Framework.log().fromException(exception)
             return None
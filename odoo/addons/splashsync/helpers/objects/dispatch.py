@@ -0,0 +1,148 @@
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import copy
+import hashlib
+import json
+from splashpy.core.framework import Framework
+
+
+class FieldsDispatcher:
+    """
+    Route Each Field to a Single Getter/Setter
+
+    Splash default parser calls every get*Fields/set*Fields method for each
+    field. Here, the first time a field is seen, all handlers are walked and
+    the one that processed the field is stored. Next requests on same object
+    class & configuration only call this handler.
+    """
+
+    # Per Worker Dispatch Tables, by Object Class & Configuration
+    __dispatch__ = {}
+
+    # Current Fields Dispatching Mode: get|set
+    mode = None
+
+    # ====================================================================#
+    # OBJECT CRUD
+    # ====================================================================#
+
+    def get(self, object_id, fields):
+        # ====================================================================#
+        # Init Reading
+        self.mode = "get"
+        self._in = fields
+        # ====================================================================#
+        # Load Object
+        self.object = False
+        self.object = self.load(object_id)
+        if self.object is False:
+            return False
+        # ====================================================================#
+        # Prefetch Object Related Data
+        self.prefetch()
+        # ====================================================================#
+        # Init Response
+        self._out = {'id': object_id}
+        # ====================================================================#
+        # Run Through All Requested Fields
+        table = self.get_dispatch_table("get")
+        for index, field in copy.copy(fields).items():
+            self.dispatch(table, self.identify_get_methods(), field, index, (index, field))
+        # ====================================================================#
+        # Verify Requested Fields List is now Empty => All Fields Read Successfully
+        if self._in.__len__():
+            for field in self._in.values():
+                Framework.log().error("Get Object - Requested field not found => " + field)
+            return False
+        # ====================================================================#
+        # Return Object Data
+        return self._out
+
+    def setObjectData(self):
+        """Execute Fields Update"""
+        self.mode = "set"
+        # ====================================================================#
+        # Walk on All Requested Fields
+        table = self.get_dispatch_table("set")
+        for field_id, field_data in copy.copy(self._in).items():
+            self.dispatch(table, self.identify_set_methods(), field_id, field_id, (field_id, field_data))
+        # ====================================================================#
+        # Verify Requested Fields List is now Empty => All Fields Read Successfully
+        if self._in.__len__():
+            for field in self._in.keys():
+                Framework.log().error("Set Object - Requested field not found => " + field)
+            return False
+
+        return True
+
+    def prefetch(self):
+        """Prefetch Data Needed to Read/Write Loaded Object"""
+        pass
+
+    # ====================================================================#
+    # Fields Dispatching
+    # ====================================================================#
+
+    def dispatch(self, table, methods, field_id, key, args):
+        """
+        Execute Field Handler
+
+        :param table: dict      Dispatch Table (field_id => method name)
+        :param methods: list    All Available Handlers
+        :param field_id: str    Field Id
+        :param key: str         Field Key in Inputs
+        :param args: tuple      Handler Arguments
+        """
+        # ====================================================================#
+        # Field Already Processed (i.e: Translations) => Skip
+        if key not in self._in:
+            return
+        # ====================================================================#
+        # Field Handler is Known => Direct Call
+        known = table.get(field_id)
+        if known is not None:
+            getattr(self, known)(*args)
+            if key not in self._in:
+                return
+        # ====================================================================#
+        # Walk on All Handlers & Learn which One Processed this Field
+        for method in methods:
+            if method.__name__ == known:
+                continue
+            method(*args)
+            if key not in self._in and field_id not in table:
+                table[field_id] = method.__name__
+
+    def get_dispatch_table(self, mode):
+        """
+        Get Dispatch Table for Current Object Class & Configuration
+        :param mode: str    get|set
+        :return: dict
+        """
+        key = (self.__class__.__name__, mode, self.get_dispatch_signature())
+        if key not in FieldsDispatcher.__dispatch__:
+            FieldsDispatcher.__dispatch__[key] = {}
+
+        return FieldsDispatcher.__dispatch__[key]
+
+    @staticmethod
+    def get_dispatch_signature():
+        """
+        Build Configuration Signature (Settings that Impact Fields Routing)
+        :return: str
+        """
+        from odoo.addons.splashsync.helpers import SettingsManager
+        settings = SettingsManager.get_objects_configuration()
+
+        return hashlib.md5(json.dumps(settings, sort_keys=True, default=str).encode()).hexdigest()
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from splashpy import Framework
+
+
+class FilesDownloader:
+    """
+    Download Files from Splash Server in Parallel
+
+    Files needed by a Set are fetched together at its beginning, through
+    a bounded threads pool, then consumed by md5 when fields are written.
+    Fetching function is injectable, by default Splash server ReadFile
+    task. Splash server connection is resolved in calling thread and given
+    to fetcher, pool threads only do remote calls: neither Odoo environment
+    nor Splash Framework globals are used there.
+    """
+
+    # Max Number of Parallel Downloads
+    max_workers = 4
+
+    # Downloaded Files, per Thread (i.e: per Request or Scheduled Action): md5 => None, dict
+    __local__ = threading.local()
+
+    @staticmethod
+    def prefetch(files, fetcher=None, max_workers=None):
+        """
+        Download a List of Splash Files in Parallel
+        :param files: list          Splash Files Fields Data
+        :param fetcher: callable    Fetch Function (path, md5) => None, dict
+        :param max_workers: int
+        :return: void
+        """
+        FilesDownloader.reset()
+        fetcher = fetcher if fetcher is not None else FilesDownloader.get_default_fetcher()
+        max_workers = max_workers if max_workers is not None else FilesDownloader.max_workers
+        # ====================================================================#
+        # Collect Unique Files
+        wanted = OrderedDict()
+        for file_data in files:
+            if not isinstance(file_data, dict) or "md5" not in file_data:
+                continue
+            wanted[file_data["md5"]] = FilesDownloader.get_path(file_data)
+        if not len(wanted):
+            return
+        # ====================================================================#
+        # Download Files
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(wanted)))) as pool:
+            futures = OrderedDict((md5, pool.submit(fetcher, path, md5)) for md5, path in wanted.items())
+        for md5, future in futures.items():
+            try:
+                FilesDownloader.get_files()[md5] = future.result()
+            except Exception as exception:
+                Framework.log().fromException(exception)
+
+    @staticmethod
+    def get(file_data, fetcher=None):
+        """
+        Get a Splash File, Downloaded Now if Not Prefetched
+        :param file_data: dict      Splash File Field Data
+        :param fetcher: callable    Fetch Function (path, md5) => None, dict
+        :return: None, dict
+        """
+        if file_data["md5"] in FilesDownloader.get_files():
+            new_file = FilesDownloader.get_files()[file_data["md5"]]
+            if isinstance(new_file, dict):
+                return new_file
+        fetcher = fetcher if fetcher is not None else FilesDownloader.get_default_fetcher()
+
+        return fetcher(FilesDownloader.get_path(file_data), file_data["md5"])
+
+    @staticmethod
+    def get_path(file_data):
+        """Get Path to Request for a Splash File"""
+        return file_data['file'] if not Framework.isDebugMode() else file_data['path']
+
+    @staticmethod
+    def get_default_fetcher(connection=None):
+        """
+        Get Splash Server Files Reader
+
+        Connection values are taken in calling thread, from its Splash
+        settings, then each download sends its own request with them.
+
+        :param connection: None, dict   Splash Server Connection
+        :return: callable
+        """
+        from odoo.addons.splashsync.helpers import FrameworkHelper
+        connection = connection if connection is not None else FrameworkHelper.get_connection()
+
+        def fetcher(path, md5):
+            response = FrameworkHelper.send(connection, "Files", FilesDownloader.encode_request(path, md5))
+            return FilesDownloader.decode_response(response)
+
+        return fetcher
+
+    @staticmethod
+    def encode_request(path, md5):
+        """
+        Build Splash Server ReadFile Request
+        :param path: str
+        :param md5: str
+        :return: dict
+        """
+        return {
+            "tasks": {
+                "task": {
+                    "id": 1,
+                    "name": "ReadFile",
+                    "desc": "Read file",
+                    "params": {"file": path, "md5": md5},
+                }
+            }
+        }
+
+    @staticmethod
+    def decode_response(response):
+        """
+        Extract Splash File from Splash Server ReadFile Response
+        :param response: False, dict
+        :return: None, dict
+        """
+        if not isinstance(response, dict) or response.get("result") != "1":
+            return None
+        try:
+            return response["tasks"]['task']["data"]
+        except Exception:
+            return None
+
+    @staticmethod
+    def get_files():
+        """
+        Get Files Downloaded by Current Thread
+        :return: dict
+        """
+        if getattr(FilesDownloader.__local__, "files", None) is None:
+            FilesDownloader.__local__.files = {}
+        return FilesDownloader.__local__.files
+
+    @staticmethod
+    def reset():
+        """Forget Downloaded Files"""
+        FilesDownloader.__local__.files = {}
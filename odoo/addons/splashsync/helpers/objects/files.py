@@ -12,6 +12,8 @@
 #  file that was distributed with this source code.
 #
 
+import base64
+import hashlib
 from odoo import http
 from splashpy.helpers import FilesHelper, ImagesHelper
 from odoo.addons.splashsync.models.configuration import ResConfigSettings
@@ -46,6 +48,72 @@ class OddoFilesHelper:
             True
         )
 
+    @staticmethod
+    def encode_field(record, field_id, name, filename, metadata=None):
+        """
+        Encode Odoo Binary Field to Splash Field Data, using Stored Metadata
+        :param record: Odoo Record
+        :param field_id: str
+        :param name: str
+        :param filename: str        Filename without Extension
+        :param metadata: None, dict Already Loaded Metadata
+        :return: None, dict
+        """
+        # ====================================================================#
+        # Load Metadata from Index, or Compute them from Contents
+        if metadata is None:
+            index = OddoFilesHelper.getIndexModel()
+            metadata = index.get_metadata(record._name, field_id, [record.id]).get(record.id)
+            if metadata is None:
+                metadata = index.update_metadata(record, field_id)
+        if metadata is None:
+            return None
+
+        return OddoFilesHelper.encode_metadata(metadata, record._name, record.id, name, filename, field_id)
+
+    @staticmethod
+    def encode_metadata(metadata, domain, object_id, name, filename, field_id):
+        """Encode Binary Metadata to Splash Field Data"""
+        # ====================================================================#
+        # Encode as Splash Images
+        if metadata["extension"]:
+            return {
+                "name": name,
+                "filename": filename + "." + str(metadata["extension"]),
+                "md5": metadata["md5"],
+                "path": OddoFilesHelper.encode_file_path(domain, object_id, field_id),
+                "size": metadata["size"],
+                "url": OddoFilesHelper.get_image_url(domain, object_id, field_id),
+                "width": metadata["width"],
+                "height": metadata["height"],
+            }
+        # ====================================================================#
+        # Encode as Splash File
+        return {
+            "name": name,
+            "filename": field_id,
+            "md5": metadata["md5"],
+            "path": OddoFilesHelper.encode_file_path(domain, object_id, field_id),
+            "size": metadata["size"],
+        }
+
+    @staticmethod
+    def get_md5(record, field_id):
+        """
+        Get Md5 of an Odoo Binary Field, using Stored Metadata
+        :param record: Odoo Record
+        :param field_id: str
+        :return: None, str
+        """
+        if not record.id:
+            return None
+        index = record.env['splash.binary.index'].sudo()
+        metadata = index.get_metadata(record._name, field_id, [record.id]).get(record.id)
+        if metadata is None:
+            metadata = index.update_metadata(record, field_id)
+
+        return metadata["md5"] if metadata is not None else None
+
     # ====================================================================#
     #  Object IMAGES Management
     # ====================================================================#
@@ -99,6 +167,11 @@ class OddoFilesHelper:
         if odoo_object is False:
             return None
         # ====================================================================#
+        # Read File from Filestore if Possible
+        splash_file = OddoFilesHelper.read_file(odoo_object, info["field"], md5)
+        if splash_file is not None:
+            return splash_file if splash_file is not False else None
+        # ====================================================================#
         # Load Object Field Contents
         b64_data = getattr(odoo_object, info["field"])
         if b64_data is None:
@@ -118,6 +191,73 @@ class OddoFilesHelper:
 
         return splashFile
 
+    @staticmethod
+    def get_local_file(md5):
+        """
+        Get a File from Local Contents if Already Stored by Another Field
+        :param md5: str
+        :return: None, dict
+        """
+        attachment_id = OddoFilesHelper.getIndexModel().find_by_md5([md5]).get(md5)
+        if attachment_id is None:
+            return None
+        b64_contents = http.request.env['ir.attachment'].sudo().browse([attachment_id]).datas
+        if not isinstance(b64_contents, bytes) or md5 != FilesHelper.md5(b64_contents, True):
+            return None
+
+        return {"md5": md5, "raw": b64_contents}
+
+    @staticmethod
+    def read_file(odoo_object, field_id, md5):
+        """
+        Read a Binary Field from its Filestore File
+
+        File is read directly, without loading field value from ORM,
+        decoding it or building its metadata again: these come from
+        binary index.
+
+        :param odoo_object: Odoo Record
+        :param field_id: str
+        :param md5: str
+        :return: None|False|dict    None if Not Readable, False if Md5 is Wrong
+        """
+        # ====================================================================#
+        # Load Stored Metadata
+        metadata = OddoFilesHelper.getIndexModel().get_metadata(
+            odoo_object._name, field_id, [odoo_object.id]
+        ).get(odoo_object.id)
+        if metadata is None or metadata["md5"] != md5:
+            return None
+        # ====================================================================#
+        # Resolve Attachment File
+        attachment = http.request.env['ir.attachment'].sudo().search([
+            ('res_model', '=', odoo_object._name),
+            ('res_field', '=', field_id),
+            ('res_id', '=', odoo_object.id),
+        ], limit=1)
+        if len(attachment) != 1 or not attachment.store_fname:
+            return None
+        # ====================================================================#
+        # Read File
+        try:
+            with open(attachment._full_path(attachment.store_fname), 'rb') as file:
+                contents = file.read()
+        except (IOError, OSError):
+            return None
+        # ====================================================================#
+        # Verify Md5
+        if hashlib.md5(contents).hexdigest() != md5:
+            return False
+        # ====================================================================#
+        # Encode Splash File
+        splash_file = OddoFilesHelper.encode_metadata(
+            metadata, odoo_object._name, odoo_object.id, field_id, field_id, field_id
+        )
+        # Add Raw Contents to Splash File
+        splash_file["raw"] = base64.b64encode(contents)
+
+        return splash_file
+
     # ====================================================================#
     # Odoo ORM Access
     # ====================================================================#
@@ -130,3 +270,13 @@ class OddoFilesHelper:
             return False
         return model
 
+    @staticmethod
+    def getIndexModel():
+        """Get Binary Metadata Index Model Class"""
+        return http.request.env['splash.binary.index'].sudo()
+
+    @staticmethod
+    def getQueueModel():
+        """Get Deferred Images Queue Model Class"""
+        return http.request.env['splash.image.queue'].sudo()
+
@@ -11,12 +11,16 @@
 #  file that was distributed with this source code.
 #
 
+import base64
 from abc import abstractmethod
 from splashpy.core.framework import Framework
 
 
 class ListsHelper:
 
+    # Per Worker Cache of Objects Counts
+    __counts__ = {}
+
     # ====================================================================#
     # Functions that Parent Class MUST Implements
     # ====================================================================#
@@ -35,6 +39,9 @@ class ListsHelper:
         """
         Get Objects List
 
+        If a cursor token is given in params, listing resumes after the last
+        returned Id (keyset pagination) and offset is ignored.
+
         :param filter: Search filters to apply (TODO)
         :param params: List pagination
         :return: object
@@ -49,9 +56,14 @@ class ListsHelper:
             offset = int(params["offset"])
         except:
             offset = 0
+        last_id = ListsHelper.decode_cursor(params)
+        is_first_page = last_id is None and offset == 0
         # ====================================================================#
         # Execute Search Query
-        results = self.getModel().search([], limit=limit, offset=offset, order='id')
+        if last_id is not None:
+            results = self.getModel().search([('id', '>', last_id)], limit=limit, order='id')
+        else:
+            results = self.getModel().search([], limit=limit, offset=offset, order='id')
         # Init Results
         objects = {}
         # Walk on Results
@@ -64,8 +76,108 @@ class ListsHelper:
         # Add Metadata
         objects['meta'] = {
             'current': results.__len__(),
-            'total': self.getModel().search_count([])
+            'total': self.get_total(is_first_page)
         }
+        if results.__len__() > 0:
+            objects['meta']['cursor'] = ListsHelper.encode_cursor(results.ids[-1])
 
         return objects
 
+    # ====================================================================#
+    # Objects Counts Management
+    # ====================================================================#
+
+    def get_total(self, refresh=False):
+        """
+        Get Total Number of Objects, from Worker Cache if Possible
+
+        Count is refreshed on first page of a listing, so a full
+        reconciliation only counts once. In estimated mode, count is
+        read from Postgres statistics instead of a full count.
+
+        :param refresh: bool    Force Count Refresh
+        :return: int
+        """
+        from odoo.addons.splashsync.helpers import SettingsManager
+        model = self.getModel()
+        key = (model.env.cr.dbname, model._name)
+        # ====================================================================#
+        # Already in Cache
+        if not refresh and key in ListsHelper.__counts__:
+            return ListsHelper.__counts__[key]
+        # ====================================================================#
+        # Count Objects
+        total = None
+        if SettingsManager.is_list_estimated():
+            total = ListsHelper.estimate_count(model)
+        if total is None:
+            total = model.search_count([])
+        ListsHelper.__counts__[key] = total
+
+        return total
+
+    @staticmethod
+    def estimate_count(model):
+        """
+        Get Approximate Number of Rows from Postgres Statistics
+        :param model: Odoo Model
+        :return: None|int
+        """
+        model.env.cr.execute("SELECT reltuples FROM pg_class WHERE relname = %s", (model._table,))
+        row = model.env.cr.fetchone()
+        # Table was never Analyzed => No Estimate
+        if row is None or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
+
+    @staticmethod
+    def count_changed(cr, domain, delta):
+        """
+        Keep Cached Count Current after Objects Create/Delete/(Un)Archive
+
+        Delta is applied once the transaction is committed, so that changes
+        later rolled back never reach the worker cache.
+
+        :param cr: Odoo Cursor
+        :param domain: str      Model Domain
+        :param delta: int       Number of Objects Added (or Removed)
+        :return: void
+        """
+        if not int(delta):
+            return
+        key = (cr.dbname, domain)
+
+        def apply_delta():
+            if key in ListsHelper.__counts__:
+                ListsHelper.__counts__[key] = max(0, ListsHelper.__counts__[key] + int(delta))
+
+        cr.after('commit', apply_delta)
+
+    # ====================================================================#
+    # Keyset Pagination Cursors
+    # ====================================================================#
+
+    @staticmethod
+    def encode_cursor(last_id):
+        """
+        Encode Last Listed Id as an Opaque Cursor Token
+        :param last_id: int
+        :return: str
+        """
+        return str(base64.urlsafe_b64encode(("id:" + str(int(last_id))).encode()), "UTF-8")
+
+    @staticmethod
+    def decode_cursor(params):
+        """
+        Decode Cursor Token from List Parameters
+        :param params: dict
+        :return: None|int
+        """
+        try:
+            token = str(base64.urlsafe_b64decode(str(params["cursor"]).encode()), "UTF-8")
+            prefix, last_id = token.split(":")
+            if prefix != "id":
+                return None
+            return int(last_id)
+        except:
+            return None
@@ -14,6 +14,7 @@
 
 from odoo import http
 from splashpy import Framework
+from ..caches import CacheManager
 
 
 class AttributesHelper:
@@ -25,6 +26,9 @@ class AttributesHelper:
     # Names of Unit Tests Variants Codes
     attr_test = ['VariantA', 'VariantB']
 
+    # Name of Per Transaction Map of Attributes: (lower(code), is_wnva) => id
+    map_name = "product.attribute"
+
     # ====================================================================#
     # Products Attributes Management
     # ====================================================================#
@@ -78,18 +82,34 @@ class AttributesHelper:
 
         :return: None, product.attribute
         """
+        key = (str(attr_code).lower(), bool(is_wnva))
+        attributes = AttributesHelper.get_map()
         # ==================================================================== #
-        # Prepare Search Filters
-        search_filters = [
-            ("name", '=ilike', attr_code),
-            ("create_variant", 'in' if is_wnva else 'not in', AttributesHelper.attr_wnva)
-        ]
-        # ==================================================================== #
-        # Search For Attribute
-        records = AttributesHelper.getModel().search(search_filters)
-        if len(records) > 0:
-            return records[0]
-        return None
+        # Search For Attribute using lower(name) Index, then in Translated Names
+        if key not in attributes:
+            cr = AttributesHelper.getModel().env.cr
+            cr.execute(
+                "SELECT id FROM product_attribute"
+                " WHERE lower(name) = %s AND create_variant " + ("IN" if is_wnva else "NOT IN") + " %s"
+                " ORDER BY sequence, id LIMIT 1",
+                (key[0], tuple(AttributesHelper.attr_wnva))
+            )
+            row = cr.fetchone()
+            if row is None:
+                cr.execute(
+                    "SELECT a.id FROM product_attribute a"
+                    " JOIN ir_translation t ON t.res_id = a.id"
+                    "   AND t.type = 'model' AND t.name = 'product.attribute,name'"
+                    " WHERE lower(t.value) = %s AND a.create_variant " + ("IN" if is_wnva else "NOT IN") + " %s"
+                    " ORDER BY a.sequence, a.id LIMIT 1",
+                    (key[0], tuple(AttributesHelper.attr_wnva))
+                )
+                row = cr.fetchone()
+            attributes[key] = row[0] if row else None
+        if attributes[key] is None:
+            return None
+
+        return AttributesHelper.getModel().browse([attributes[key]])
 
     @staticmethod
     def load(attr_id):
@@ -115,11 +135,32 @@ class AttributesHelper:
 
         :return: None, product.attribute
         """
-        return AttributesHelper.getModel().create({
+        attribute = AttributesHelper.getModel().create({
             "name": attr_code,
             "type": "select",
             "create_variant": "no_variant" if is_wnva else "always"
         })
+        AttributesHelper.get_map()[(str(attr_code).lower(), bool(is_wnva))] = attribute.id
+
+        return attribute
+
+    @staticmethod
+    def get_map():
+        """
+        Get Attributes Found During Current Transaction
+
+        Map is forgotten on commit & rollback, so that attributes created,
+        renamed or rolled back by other requests or scheduled actions are
+        never missed.
+
+        :return: dict
+        """
+        return CacheManager.get_transaction_cache(AttributesHelper.getModel().env.cr, AttributesHelper.map_name)
+
+    @staticmethod
+    def reset():
+        """Forget Attributes Found During Current Transaction"""
+        AttributesHelper.get_map().clear()
 
     # ====================================================================#
     # Odoo ORM Access
@@ -134,6 +175,9 @@ class AttributesHelper:
 class ValuesHelper:
     """Collection of Static Functions to Manage Product Attributes Values"""
 
+    # Name of Per Transaction Map of Values: (attribute_id, lower(value)) => id
+    map_name = "product.attribute.value"
+
     @staticmethod
     def touch(attribute, attr_value, is_wnva):
         """
@@ -158,13 +202,50 @@ class ValuesHelper:
             return None
         # ====================================================================#
         # Search for Value in Attribute
-        values = attribute.value_ids.filtered(lambda r: r.name.lower() == attr_value.lower())
-        if len(values) > 0:
-            return values[0]
+        value = ValuesHelper.find(attribute, attr_value)
+        if value is not None:
+            return value
         # ====================================================================#
         # Crate New Value for Attribute
         return ValuesHelper.create(attribute, attr_value)
 
+    @staticmethod
+    def find(attribute, attr_value):
+        """
+        Find a Product Attribute Value by Name, Case Insensitive
+        :param attribute: product.attribute
+        :param attr_value: str
+        :return: None, product.attribute.value
+        """
+        key = (attribute.id, str(attr_value).lower())
+        values = ValuesHelper.get_map()
+        # ====================================================================#
+        # Search using (attribute_id, lower(name)) Index, then in Translated Names
+        if key not in values:
+            cr = ValuesHelper.getModel().env.cr
+            cr.execute(
+                "SELECT id FROM product_attribute_value"
+                " WHERE attribute_id = %s AND lower(name) = %s"
+                " ORDER BY sequence, id LIMIT 1",
+                (key[0], key[1])
+            )
+            row = cr.fetchone()
+            if row is None:
+                cr.execute(
+                    "SELECT v.id FROM product_attribute_value v"
+                    " JOIN ir_translation t ON t.res_id = v.id"
+                    "   AND t.type = 'model' AND t.name = 'product.attribute.value,name'"
+                    " WHERE v.attribute_id = %s AND lower(t.value) = %s"
+                    " ORDER BY v.sequence, v.id LIMIT 1",
+                    (key[0], key[1])
+                )
+                row = cr.fetchone()
+            values[key] = row[0] if row else None
+        if values[key] is None:
+            return None
+
+        return ValuesHelper.getModel().browse([values[key]])
+
     @staticmethod
     def create(attribute, attr_value):
         """
@@ -173,10 +254,26 @@ class ValuesHelper:
         :param attr_value: str
         :return: product.attribute.value
         """
-        return ValuesHelper.getModel().create({
+        value = ValuesHelper.getModel().create({
             "name": attr_value,
             "attribute_id": attribute.id,
         })
+        ValuesHelper.get_map()[(attribute.id, str(attr_value).lower())] = value.id
+
+        return value
+
+    @staticmethod
+    def get_map():
+        """
+        Get Values Found During Current Transaction
+        :return: dict
+        """
+        return CacheManager.get_transaction_cache(ValuesHelper.getModel().env.cr, ValuesHelper.map_name)
+
+    @staticmethod
+    def reset():
+        """Forget Values Found During Current Transaction"""
+        ValuesHelper.get_map().clear()
 
     # ====================================================================#
     # Odoo ORM Access
@@ -210,6 +307,99 @@ class LinesHelper:
         # Add Attribute Line
         template.attribute_line_ids = [(0, 0, new_line)]
 
+    @staticmethod
+    def add_value(template, value):
+        """
+        Ensure a Value is on its Product Template Attribute Line
+        :param template: product.template
+        :param value: product.attribute.value
+        :return: None
+        """
+        filtered_lines = template.attribute_line_ids.filtered(
+            lambda l: l.attribute_id.id == value.attribute_id.id
+        )
+        # ====================================================================#
+        # Line NOT Found => Add New Line
+        if len(filtered_lines) == 0:
+            return LinesHelper.add(template, value)
+        # ====================================================================#
+        # Value NOT in Line => Add Value
+        if value.id not in filtered_lines[0].value_ids.ids:
+            filtered_lines[0].value_ids = [(4, value.id, 0)]
+
+    @staticmethod
+    def remove_value(template, value):
+        """
+        Remove a Value from its Product Template Attribute Line if No Variant Use it Anymore
+        :param template: product.template
+        :param value: product.attribute.value
+        :return: None
+        """
+        # ====================================================================#
+        # Value Still Used by Other Variants => Nothing to Do
+        if LinesHelper.count_variants(template, value) > 0:
+            return
+        filtered_lines = template.attribute_line_ids.filtered(
+            lambda l: l.attribute_id.id == value.attribute_id.id
+        )
+        if len(filtered_lines) == 0 or value.id not in filtered_lines[0].value_ids.ids:
+            return
+        # ====================================================================#
+        # Last Value of Line => Remove Line
+        if len(filtered_lines[0].value_ids) == 1:
+            template.attribute_line_ids = [(2, filtered_lines[0].id, 0)]
+            return
+        # ====================================================================#
+        # Remove Value from Line
+        filtered_lines[0].value_ids = [(3, value.id, 0)]
+
+    @staticmethod
+    def count_variants(template, value):
+        """
+        Count Active Template Variants Using a Value, in a Single Query
+        :param template: product.template
+        :param value: product.attribute.value
+        :return: int
+        """
+        field = template.env["product.product"]._fields["attribute_value_ids"]
+        template.env.cr.execute(
+            "SELECT count(*) FROM " + field.relation + " r"
+            " JOIN product_product p ON p.id = r." + field.column1 +
+            " WHERE p.product_tmpl_id = %s AND p.active AND r." + field.column2 + " = %s",
+            (template.id, value.id)
+        )
+        return template.env.cr.fetchone()[0]
+
+    @staticmethod
+    def repair(template, active_test=True):
+        """
+        Rebuild All Product Template Attribute Lines from its Variants Values
+
+        Lines only list values used by variants, lines of variants attributes
+        no variant uses anymore are removed. Features lines are kept.
+
+        :param template: product.template
+        :param active_test: bool
+        :return: None
+        """
+        variants = template.with_context(active_test=active_test).product_variant_ids
+        used = {}
+        for value in variants.mapped("attribute_value_ids"):
+            if not AttributesHelper.is_wnva(value.attribute_id):
+                used.setdefault(value.attribute_id, []).append(value.id)
+        # ====================================================================#
+        # Remove Lines of Unused Variants Attributes
+        for line in template.attribute_line_ids:
+            if line.attribute_id not in used and not AttributesHelper.is_wnva(line.attribute_id):
+                LinesHelper.set(template, line.attribute_id, [])
+        # ====================================================================#
+        # Update Lines with Used Values Only
+        for attribute, values_ids in used.items():
+            lines = template.attribute_line_ids.filtered(lambda l: l.attribute_id.id == attribute.id)
+            if len(lines) == 1 and set(lines.value_ids.ids) == set(values_ids):
+                continue
+            LinesHelper.set(template, attribute, values_ids)
+
     @staticmethod
     def set(template, attribute, value_ids):
         """
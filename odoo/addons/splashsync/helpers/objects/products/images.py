@@ -38,73 +38,69 @@ class ProductImagesHelper:
         :param value_id: str
         :return: dict
         """
-        position = 1
-        values = []
+        return [image[value_id] for image in ProductImagesHelper.get_list(product) if value_id in image]
+
+    @staticmethod
+    def get_list(product):
+        """
+        Build Product Images List in a Single Pass
+
+        All images list columns are built together. Images metadata are
+        loaded from binary index in one query per images model, only
+        images missing in index are decoded to compute them.
+
+        :param product: product.product
+        :return: list
+        """
         from odoo.addons.splashsync.helpers import OddoFilesHelper
+        position = 1
+        images = []
+        index = OddoFilesHelper.getIndexModel()
+        tmpl = product.product_tmpl_id[0]
+        variants = product.product_variant_ids.sorted(key=lambda r: r.id)
+        tmpl_images = product.product_image_ids.sorted(key=lambda r: r.id)
+        # ====================================================================#
+        # Load Stored Images Metadata
+        tmpl_metas = index.get_metadata(ProductImagesHelper.tmpl_domain, "image", tmpl.ids)
+        variants_metas = index.get_metadata(ProductImagesHelper.prd_domain, "image_variant", variants.ids)
+        images_metas = index.get_metadata(ProductImagesHelper.img_domain, "image", tmpl_images.ids)
         # ====================================================================#
         # Read Product Main Image
-        tmpl = product.product_tmpl_id[0]
-        if isinstance(tmpl.image, bytes):
-            if value_id == "cover":
-                values += [True]
-            elif value_id == "visible":
-                values += [True]
-            elif value_id == "position":
-                values += [position]
-                position += 1
-            elif value_id == "image":
-                values += [ImagesHelper.encodeFromRaw(
-                    tmpl.image,
-                    "Main Image",
-                    "main_image." + str(ImagesHelper.get_extension(tmpl.image, True)),
-                    OddoFilesHelper.encode_file_path(ProductImagesHelper.tmpl_domain, tmpl.id, "image"),
-                    OddoFilesHelper.get_image_url(ProductImagesHelper.tmpl_domain, tmpl.id, "image"),
-                    True
-                )]
+        main_image = OddoFilesHelper.encode_field(tmpl, "image", "Main Image", "main_image", tmpl_metas.get(tmpl.id))
+        if main_image is not None:
+            images += [{"cover": True, "visible": True, "position": position, "image": main_image}]
+            position += 1
         # ====================================================================#
         # Walk on Product Variants Images
-        for variant in product.product_variant_ids.sorted(key=lambda r: r.id):
+        for variant in variants:
             # Verify if Image Exist
-            if not isinstance(variant.image_variant, bytes):
+            variant_image = OddoFilesHelper.encode_field(
+                variant, "image_variant", "Variant Image", "variant_image", variants_metas.get(variant.id)
+            )
+            if variant_image is None:
                 continue
             # Add Image Value
-            if value_id == "cover":
-                values += [False]
-            elif value_id == "visible":
-                values += [bool(variant.id == product.id)]
-            elif value_id == "position":
-                values += [position]
-                position += 1
-            elif value_id == "image":
-                values += [ImagesHelper.encodeFromRaw(
-                    variant.image_variant,
-                    "Variant Image",
-                    "variant_image." + str(ImagesHelper.get_extension(variant.image, True)),
-                    OddoFilesHelper.encode_file_path(ProductImagesHelper.prd_domain, variant.id, "image_variant"),
-                    OddoFilesHelper.get_image_url(ProductImagesHelper.prd_domain, variant.id, "image_variant"),
-                    True
-                )]
+            images += [{
+                "cover": False,
+                "visible": bool(variant.id == product.id),
+                "position": position,
+                "image": variant_image,
+            }]
+            position += 1
         # ====================================================================#
         # Walk on Product Images
-        for tmpl_image in product.product_image_ids.sorted(key=lambda r: r.id):
-            if value_id == "cover":
-                values += [False]
-            elif value_id == "visible":
-                values += [True]
-            elif value_id == "position":
-                values += [position]
-                position += 1
-            elif value_id == "image":
-                values += [ImagesHelper.encodeFromRaw(
-                    tmpl_image.image,
-                    tmpl_image.name,
-                    tmpl_image.name + "." + str(ImagesHelper.get_extension(tmpl_image.image, True)),
-                    OddoFilesHelper.encode_file_path(ProductImagesHelper.img_domain, tmpl_image.id, "image"),
-                    OddoFilesHelper.get_image_url(ProductImagesHelper.img_domain, tmpl_image.id, "image"),
-                    True
-                )]
-
-        return values
+        for tmpl_image in tmpl_images:
+            images += [{
+                "cover": False,
+                "visible": True,
+                "position": position,
+                "image": OddoFilesHelper.encode_field(
+                    tmpl_image, "image", tmpl_image.name, tmpl_image.name, images_metas.get(tmpl_image.id)
+                ),
+            }]
+            position += 1
+
+        return images
 
     @staticmethod
     def sort_images(images_list):
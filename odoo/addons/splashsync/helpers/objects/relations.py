@@ -12,9 +12,12 @@
 #
 
 import json
+from collections import OrderedDict
 from odoo import http
 from splashpy import Framework
 from splashpy.helpers.objects import ObjectsHelper
+from .caches import CacheManager
+from .writes import WritesBuffer
 
 
 class M2MHelper:
@@ -59,7 +62,7 @@ class M2MHelper:
         verified_ids = M2MHelper.__verify_ids(valid_ids, domain, filters)
         # ==================================================================== #
         # Update M2M ORM Values
-        setattr(inputs, field, [(6, 0, verified_ids)])
+        WritesBuffer.set(inputs, field, [(6, 0, verified_ids)])
 
     @staticmethod
     def set_names(inputs, field, data, index="name", domain=None, filters=[]):
@@ -85,7 +88,7 @@ class M2MHelper:
             return
         # ==================================================================== #
         # Update M2M ORM Values
-        setattr(inputs, field, [(6, 0, verified_ids)])
+        WritesBuffer.set(inputs, field, [(6, 0, verified_ids)])
 
     @staticmethod
     def get_names(inputs, field, index="name"):
@@ -153,12 +156,11 @@ class M2MHelper:
         # No Domain or Filter => Skip
         if domain is None or not isinstance(domain, str) or len(domain) < 5:
             return data
+        if len(data) == 0:
+            return []
         # Execute Domain Search with Filter
-        verified_ids = []
-        for data_id in data:
-            if M2OHelper.verify_id(data_id, domain, filters):
-                verified_ids += [int(data_id)]
-        return verified_ids
+        found_ids = http.request.env[domain].search([('id', 'in', data)] + filters).ids
+        return [int(data_id) for data_id in data if int(data_id) in found_ids]
 
     @staticmethod
     def __verify_names(data, index, domain, filters=[]):
@@ -172,16 +174,29 @@ class M2MHelper:
         """
         # Execute Domain Search with Filter
         verified_ids = []
+        verified = M2OHelper.verify_names(data, index, domain, filters)
         for data_name in data:
-            verified_id = M2OHelper.verify_name(data_name, index, domain, filters)
-            if isinstance(verified_id, int):
-                verified_ids += [verified_id]
+            if isinstance(verified.get(data_name), int):
+                verified_ids += [verified[data_name]]
         return verified_ids
 
 
 class M2OHelper:
     """Many 2 One Relations Helper"""
 
+    # Per Worker LRU Cache of Names Search Results: key => None, int
+    __names__ = OrderedDict()
+    # Max Number of Names in Cache
+    cache_size = 2048
+    # Reference Models where Names Search Results are Cached
+    cached_domains = [
+        "product.category",
+        "product.public.category",
+        "product.brand",
+        "stock.location.route",
+        "res.company",
+    ]
+
     @staticmethod
     def get_id(inputs, field):
         """
@@ -263,10 +278,10 @@ class M2OHelper:
         # Verify Values Exists
         if M2OHelper.verify_id(object_id, domain, filters):
             # Update M2O ORM Values
-            setattr(inputs, field, int(object_id))
+            WritesBuffer.set(inputs, field, int(object_id))
         else:
             try:
-                setattr(inputs, field, False)
+                WritesBuffer.set(inputs, field, False)
             except:
                 pass
 
@@ -337,21 +352,88 @@ class M2OHelper:
         # No Domain or Filter => Skip
         if not isinstance(object_name, str) or not isinstance(index, str) or not isinstance(domain, str):
             return None
-        # Execute Domain Search with Filter
-        results = http.request.env[domain].search([(index, '=ilike', object_name)] + filters)
 
-        # Results Found => Ok
-        if len(results) > 0:
+        return M2OHelper.verify_names([object_name], index, domain, filters)[object_name]
+
+    @staticmethod
+    def verify_names(object_names, index, domain, filters=[]):
+        """
+        Validate a List of Names with a Single Search
+        :param object_names: list   Names to Verify
+        :param index: str           Property Name
+        :param domain: str          Target Objects Domain
+        :param filters: list        Additional Search Filters
+        :return: dict               Name => None, int
+        """
+        results = {}
+        missing = []
+        # No Domain or Filter => Skip
+        if not isinstance(index, str) or not isinstance(domain, str):
+            return {object_name: None for object_name in object_names}
+        # ==================================================================== #
+        # Load Names from Cache
+        for object_name in object_names:
+            key = M2OHelper.__get_cache_key(object_name, index, domain, filters)
+            if key is not None and key in M2OHelper.__names__:
+                M2OHelper.__names__.move_to_end(key)
+                results[object_name] = M2OHelper.__names__[key]
+            elif object_name not in missing:
+                missing += [object_name]
+        if len(missing) == 0:
+            return results
+        # ==================================================================== #
+        # Execute Domain Search with Filter
+        search = ['|'] * (len(missing) - 1) + [(index, '=ilike', object_name) for object_name in missing]
+        found = {}
+        for record in http.request.env[domain].search(search + filters):
+            name = str(getattr(record, index)).lower()
+            found[name] = found.get(name, []) + [record.id]
+        for object_name in missing:
+            found_ids = found.get(object_name.lower(), [])
             # More than One Result Found => Ok but Warning
-            if len(results) > 1:
+            if len(found_ids) > 1:
                 war = "More than One result by name search: "
-                war += "'"+object_name+"' Name was found "+str(len(results))+" times"
+                war += "'"+object_name+"' Name was found "+str(len(found_ids))+" times"
                 war += " on table '"+domain+"'. First value was used."
                 Framework.log().warn(war)
             # Return first result
-            return results[0].id
-        else:
-            return None
+            results[object_name] = found_ids[0] if len(found_ids) > 0 else None
+            M2OHelper.__set_cache(object_name, index, domain, filters, results[object_name])
 
+        return results
 
+    # ====================================================================#
+    # Names Search Cache
+    # ====================================================================#
+
+    @staticmethod
+    def __get_cache_key(object_name, index, domain, filters):
+        """
+        Build Names Cache Key, None if Domain is Not Cached
+        :return: None, tuple
+        """
+        if domain not in M2OHelper.cached_domains:
+            return None
+        env = http.request.env
+        return (
+            env.cr.dbname,
+            CacheManager.get_version(env, [domain]),
+            domain,
+            repr(filters),
+            index,
+            object_name.lower()
+        )
 
+    @staticmethod
+    def __set_cache(object_name, index, domain, filters, value):
+        """
+        Store a Name Search Result in Cache
+        :return: void
+        """
+        key = M2OHelper.__get_cache_key(object_name, index, domain, filters)
+        if key is None:
+            return
+        M2OHelper.__names__[key] = value
+        M2OHelper.__names__.move_to_end(key)
+        while len(M2OHelper.__names__) > M2OHelper.cache_size:
+            M2OHelper.__names__.popitem(last=False)
@@ -0,0 +1,127 @@
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import hashlib
+
+
+class SchemaHelper:
+    """Registry Scoped Cache of Odoo Models Fields Definitions"""
+
+    # Fields Definitions Attributes Used by Splash
+    attributes = ["type", "string", "required", "readonly", "help", "translate", "selection"]
+
+    # Per Worker Cache of Fields Definitions, Grouped by Types
+    __schemas__ = {}
+
+    # Per Worker Cache of Installed Modules Signatures, by Registry Load
+    __signatures__ = {}
+
+    # Per Worker Cache of Active Languages Codes, by Registry Load
+    __languages__ = {}
+
+    @staticmethod
+    def get_types(model):
+        """
+        Get Model Fields Definitions Grouped by Field Type
+
+        Definitions are loaded with a single fields_get() call, then
+        cached by Database, Model, Language & Installed Modules.
+
+        :param model: Odoo Model
+        :return: dict
+        """
+        key = SchemaHelper.get_key(model)
+        # ====================================================================#
+        # Already in Cache
+        if key in SchemaHelper.__schemas__:
+            return SchemaHelper.__schemas__[key]
+        # ====================================================================#
+        # Load & Classify Fields Definitions
+        types = {}
+        for field_id, field in model.fields_get(attributes=SchemaHelper.attributes).items():
+            if field["type"] not in types:
+                types[field["type"]] = {}
+            types[field["type"]][field_id] = field
+        SchemaHelper.__schemas__[key] = types
+
+        return types
+
+    @staticmethod
+    def has_field(model, field_id):
+        """
+        Check if Model has a Field
+        :param model: Odoo Model
+        :param field_id: str
+        :return: bool
+        """
+        for fields in SchemaHelper.get_types(model).values():
+            if field_id in fields:
+                return True
+        return False
+
+    @staticmethod
+    def get_key(model):
+        """
+        Build Cache Key for a Model
+        :param model: Odoo Model
+        :return: tuple
+        """
+        return (
+            model.env.cr.dbname,
+            model._name,
+            model.env.lang,
+            SchemaHelper.get_signature(model.env)
+        )
+
+    @staticmethod
+    def get_signature(env):
+        """
+        Build Installed Modules Signature for a Registry
+
+        Modules are only installed or upgraded with a registry reload,
+        so signature is computed once per registry load.
+
+        :param env: Odoo Environment
+        :return: str
+        """
+        key = (env.cr.dbname, getattr(env.registry, "registry_sequence", None))
+        if key not in SchemaHelper.__signatures__:
+            env.cr.execute(
+                "SELECT name, latest_version FROM ir_module_module WHERE state = 'installed' ORDER BY name"
+            )
+            modules = ",".join(str(name) + ":" + str(version) for name, version in env.cr.fetchall())
+            SchemaHelper.__signatures__[key] = hashlib.md5(modules.encode()).hexdigest()
+
+        return SchemaHelper.__signatures__[key]
+
+    @staticmethod
+    def get_languages(env):
+        """
+        Get Active Languages Codes for a Registry
+
+        Languages are cached like modules signatures, so that Describe
+        requests don't query them again.
+
+        :param env: Odoo Environment
+        :return: list
+        """
+        key = (env.cr.dbname, getattr(env.registry, "registry_sequence", None))
+        if key not in SchemaHelper.__languages__:
+            env.cr.execute("SELECT code FROM res_lang WHERE active ORDER BY code")
+            SchemaHelper.__languages__[key] = [row[0] for row in env.cr.fetchall()]
+
+        return SchemaHelper.__languages__[key]
+
+    @staticmethod
+    def reset():
+        SchemaHelper.__schemas__ = {}
@@ -14,6 +14,7 @@
 
 from odoo import http
 from splashpy import Framework
+from .caches import CacheManager
 
 
 class TaxHelper:
@@ -21,29 +22,88 @@ class TaxHelper:
 
     tax_domain = "account.tax"
 
+    # Per Worker Taxes Indexes, by Database, Company & Taxes Version
+    __indexes__ = {}
+
     @staticmethod
     def get_tax_rate(taxes_ids, type_tax_use):
+        index = TaxHelper.get_index()
+        key = (tuple(sorted(taxes_ids.ids)), type_tax_use)
+        # ====================================================================#
+        # Taxes Set Effective Rate Already Computed
+        if key in index["sets"]:
+            return index["sets"][key]
         tax_rate = 0.0
-        for tax in taxes_ids:
-            tax_rate += TaxHelper.__get_tax_rate(tax, type_tax_use)
+        for tax_id in key[0]:
+            tax_rate += TaxHelper.__get_tax_rate(index["taxes"], tax_id, type_tax_use)
+        index["sets"][key] = tax_rate
+
         return tax_rate
 
     @staticmethod
-    def __get_tax_rate(tax, type_tax_use):
+    def __get_tax_rate(taxes, tax_id, type_tax_use):
         tax_rate = 0
+        tax = taxes.get(tax_id)
+        if tax is None:
+            return tax_rate
         # Filter on Taxes types
-        if tax.type_tax_use != type_tax_use:
+        if type_tax_use is not None and tax["type_tax_use"] != type_tax_use:
             return tax_rate
         # Tax By Percent
-        if tax.amount_type == "percent":
-            return tax.amount
-        # Tax Group
-        if len(tax.children_tax_ids) > 0:
-            for child_tax in tax.children_tax_ids:
-                tax_rate += TaxHelper.__get_tax_rate(child_tax)
+        if tax["amount_type"] == "percent":
+            return tax["amount"]
+        # Tax Group => Children Types are Not Filtered
+        for child_tax_id in tax["children_tax_ids"]:
+            tax_rate += TaxHelper.__get_tax_rate(taxes, child_tax_id, None)
 
         return tax_rate
 
+    # ====================================================================#
+    # Taxes Index
+    # ====================================================================#
+
+    @staticmethod
+    def get_index():
+        """
+        Get Taxes Index for Current Company
+
+        Index is built with a single read of all taxes:
+            - taxes:    tax id => tax data
+            - rates:    (rate, type_tax_use) => tax id, active percent taxes
+                        of current company first, then Odoo taxes ordering
+            - sets:     (taxes ids, type_tax_use) => effective rate memo
+
+        :return: dict
+        """
+        from odoo.addons.splashsync.helpers import SettingsManager
+        env = http.request.env
+        company_id = SettingsManager.get_company_id()
+        key = (env.cr.dbname, company_id, CacheManager.get_version(env, [TaxHelper.tax_domain]))
+        if key in TaxHelper.__indexes__:
+            return TaxHelper.__indexes__[key]
+        # ====================================================================#
+        # Load All Taxes
+        index = {"taxes": {}, "rates": {}, "sets": {}}
+        taxes = TaxHelper.getModel().with_context(active_test=False).search_read([], [
+            "amount", "amount_type", "type_tax_use", "children_tax_ids", "company_id", "active"
+        ])
+        for tax in taxes:
+            index["taxes"][tax["id"]] = tax
+        # ====================================================================#
+        # Index Active Percent Taxes by Rate
+        for tax in sorted(taxes, key=lambda t: not t["company_id"] or t["company_id"][0] != company_id):
+            if not tax["active"] or tax["amount_type"] != "percent":
+                continue
+            rate_key = (TaxHelper.__get_rate_key(tax["amount"]), tax["type_tax_use"])
+            if rate_key not in index["rates"]:
+                index["rates"][rate_key] = tax["id"]
+
+        return CacheManager.store(TaxHelper.__indexes__, key, index)
+
+    @staticmethod
+    def __get_rate_key(tax_rate):
+        return round(float(tax_rate), 4)
+
     # ====================================================================#
     # Odoo ORM Access
     # ====================================================================#
@@ -51,14 +111,11 @@ class TaxHelper:
     @staticmethod
     def find_by_rate(tax_rate, type_tax_use):
         """Find Odoo Tax by Rate"""
-        taxes = TaxHelper.getModel().search([
-            ("amount", "=", tax_rate),
-            ("amount_type", "=", "percent"),
-            ("type_tax_use", "=", type_tax_use),
-        ])
-        if len(taxes) == 0:
+        rate_key = (TaxHelper.__get_rate_key(tax_rate), type_tax_use)
+        tax_id = TaxHelper.get_index()["rates"].get(rate_key)
+        if tax_id is None:
             return TaxHelper.__create_for_debug(tax_rate, type_tax_use)
-        return taxes[0]
+        return TaxHelper.getModel().browse([tax_id])
 
     @staticmethod
     def __create_for_debug(tax_rate, type_tax_use):
@@ -76,9 +133,13 @@ class TaxHelper:
             "sequence": 1,
             "tax_group_id": 1,
         }
-        return TaxHelper.getModel().create(tax_data)
+        tax = TaxHelper.getModel().create(tax_data)
+        CacheManager.notify(tax)
+
+        return tax
 
     @staticmethod
     def getModel():
         """Get Taxes Model Class"""
         return http.request.env[TaxHelper.tax_domain].sudo()
+
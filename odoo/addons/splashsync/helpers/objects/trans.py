@@ -12,8 +12,9 @@
 #  file that was distributed with this source code.
 #
 
+import threading
 from odoo import http
-
+from .writes import WritesBuffer
 
 
 class TransHelper:
@@ -27,6 +28,11 @@ class TransHelper:
     extra_langs = None
     extra_iso = None
 
+    # Per Thread (i.e: per Request) Translations State:
+    #   - cache:    prefetched translations, (name, lang, res_id) => value
+    #   - pending:  buffered translations writes, (name, lang, res_id) => (model, field, value)
+    __local__ = threading.local()
+
     langs_domain = "res.lang"
     trans_domain = "ir.translation"
 
@@ -56,9 +62,17 @@ class TransHelper:
         :param iso_lang: str
         :return: str
         """
+        # ====================================================================#
+        # Translation was Prefetched
+        key = (TransHelper.get_name(model, field_name), iso_lang, model.id)
+        cache = TransHelper.get_cache()
+        if cache is not None and key in cache:
+            if isinstance(cache[key], str):
+                return cache[key]
+            return default
         try:
             translations = TransHelper.getModel()._get_ids(
-                model.__class__.__name__+","+field_name,
+                TransHelper.get_name(model, field_name),
                 "model",
                 iso_lang,
                 [model.id]
@@ -81,18 +95,192 @@ class TransHelper:
         :param value: str
         :return: void
         """
+        key = (TransHelper.get_name(model, field_name), iso_lang, model.id)
+        # ====================================================================#
+        # Translation is Buffered => Store for Flush
+        cache = TransHelper.get_cache()
+        if TransHelper.get_pending() is not None:
+            if cache is not None and key in cache and TransHelper.is_equal(cache[key], value):
+                WritesBuffer.count("skipped")
+                return
+            TransHelper.get_pending()[key] = (model, field_name, value)
+            if cache is not None:
+                cache[key] = value
+            return
         try:
-            TransHelper.getModel()._set_ids(
-                model.__class__.__name__+","+field_name,
-                "model",
-                iso_lang,
-                [model.id],
-                value
-            )
+            TransHelper.getModel()._set_ids(key[0], "model", iso_lang, [model.id], value)
+            if cache is not None:
+                cache[key] = value
         except Exception as exception:
             from splashpy import Framework
             Framework.log().fromException(exception)
 
+    @staticmethod
+    def get_name(model, field_name):
+        """
+        Get Translation Name for a Model Field
+        :param model: model
+        :param field_name: str
+        :return: str
+        """
+        return model.__class__.__name__+","+field_name
+
+    # ====================================================================#
+    # Translations Prefetch
+    # ====================================================================#
+
+    @staticmethod
+    def prefetch(records, field_names, langs=None):
+        """
+        Load All Translations for Records Fields in a Single Query
+        :param records: recordset
+        :param field_names: list
+        :param langs: None, list    Languages to Load (Default: Extra Languages)
+        :return: void
+        """
+        if TransHelper.get_cache() is None:
+            TransHelper.__local__.cache = {}
+        cache = TransHelper.get_cache()
+        langs = list(TransHelper.get_extra_iso()) if langs is None else list(langs)
+        if not len(records) or not len(field_names) or not len(langs):
+            return
+        names = [TransHelper.get_name(records, field_name) for field_name in field_names]
+        # ====================================================================#
+        # Init Requested Keys => Missing Translations are Known
+        for name in names:
+            for lang in langs:
+                for res_id in records.ids:
+                    cache[(name, lang, res_id)] = None
+        # ====================================================================#
+        # Load Translations
+        try:
+            translations = TransHelper.getModel().search_read([
+                ("type", "=", "model"),
+                ("name", "in", names),
+                ("lang", "in", langs),
+                ("res_id", "in", records.ids),
+            ], ["name", "lang", "res_id", "value"])
+        except Exception as exception:
+            from splashpy import Framework
+            Framework.log().fromException(exception)
+            TransHelper.reset_cache()
+            return
+        for translation in translations:
+            cache[(translation["name"], translation["lang"], translation["res_id"])] = translation["value"]
+
+    # ====================================================================#
+    # Translations Writes Buffer
+    # ====================================================================#
+
+    @staticmethod
+    def buffer():
+        """Start Buffering Translations Writes"""
+        TransHelper.__local__.pending = {}
+
+    @staticmethod
+    def flush():
+        """
+        Write All Buffered Translations in Bulk & Stop Buffering
+
+        Existing translations are updated with a single SQL query,
+        missing ones are created with a single multi-records create.
+
+        :return: bool
+        """
+        pending = TransHelper.get_pending()
+        TransHelper.__local__.pending = None
+        if not pending:
+            return True
+        try:
+            translations = TransHelper.getModel()
+            # ====================================================================#
+            # Find Existing Translations
+            existing = {}
+            for translation in translations.search_read([
+                ("type", "=", "model"),
+                ("name", "in", list(set(key[0] for key in pending.keys()))),
+                ("lang", "in", list(set(key[1] for key in pending.keys()))),
+                ("res_id", "in", list(set(key[2] for key in pending.keys()))),
+            ], ["name", "lang", "res_id", "value"]):
+                existing[(translation["name"], translation["lang"], translation["res_id"])] = translation
+            # ====================================================================#
+            # Skip Unchanged Translations
+            for key, (model, field_name, value) in list(pending.items()):
+                if TransHelper.is_equal(existing[key]["value"] if key in existing else None, value):
+                    WritesBuffer.count("skipped")
+                    del pending[key]
+            WritesBuffer.count("written", len(pending))
+            if not pending:
+                return True
+            # ====================================================================#
+            # Update Existing Translations
+            updates = [
+                (existing[key]["id"], value) for key, (model, field_name, value) in pending.items() if key in existing
+            ]
+            if len(updates):
+                cr = translations.env.cr
+                values = ", ".join(cr.mogrify("(%s, %s)", update).decode() for update in updates)
+                cr.execute(
+                    "UPDATE ir_translation AS t SET value = v.value, state = 'translated' "
+                    "FROM (VALUES " + values + ") AS v(id, value) WHERE t.id = v.id"
+                )
+                translations.invalidate_cache(['value', 'state'], [update[0] for update in updates])
+            # ====================================================================#
+            # Create Missing Translations
+            creates = [{
+                'lang': key[1],
+                'type': 'model',
+                'name': key[0],
+                'res_id': key[2],
+                'value': value,
+                'src': None,
+                'state': 'translated',
+            } for key, (model, field_name, value) in pending.items() if key not in existing]
+            if len(creates):
+                translations.create(creates)
+            # ====================================================================#
+            # Invalidate Translated Fields Caches
+            for model_name in set(model._name for model, field_name, value in pending.values()):
+                translations._modified_model(model_name)
+            for model, field_name, value in pending.values():
+                model.invalidate_cache([field_name], model.ids)
+        except Exception as exception:
+            from splashpy import Framework
+            return Framework.log().fromException(exception)
+
+        return True
+
+    @staticmethod
+    def is_equal(current, value):
+        """
+        Compare Translations, Empty Values are Similar
+        :param current: None, str
+        :param value: None, str
+        :return: bool
+        """
+        return (str(current) if current else False) == (str(value) if value else False)
+
+    @staticmethod
+    def get_cache():
+        """
+        Get Prefetched Translations of Current Thread
+        :return: None, dict
+        """
+        return getattr(TransHelper.__local__, "cache", None)
+
+    @staticmethod
+    def get_pending():
+        """
+        Get Buffered Translations Writes of Current Thread
+        :return: None, dict
+        """
+        return getattr(TransHelper.__local__, "pending", None)
+
+    @staticmethod
+    def reset_cache():
+        """Forget Prefetched Translations"""
+        TransHelper.__local__.cache = None
+
     # ====================================================================#
     # Languages Management
     # ====================================================================#
@@ -0,0 +1,295 @@
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from odoo import fields, models
+from odoo.tools import float_compare
+from splashpy import Framework
+
+
+class WritesBuffer:
+    """
+    Collect Fields Changes during Set to Execute a Single write() per Record
+
+    Each field assignment on an Odoo record is a write on its own, with its
+    own recompute & write_date update. While buffering, changes are stored
+    by record and written all together when object is updated.
+
+    Received values are normalized & compared with current ones, unchanged
+    values are never written, so that echoed values don't touch records.
+
+    Buffered writes & counters are kept per thread, i.e: per request.
+    """
+
+    # Per Thread Buffer State:
+    #   - pending:  buffered writes, (model name, record id) => (record, vals)
+    #   - stats:    fields writes counters, written & skipped (unchanged) values,
+    #               from buffering start until reset
+    __local__ = threading.local()
+
+    # Fields Types Written at Once
+    direct_types = ["binary"]
+
+    # ====================================================================#
+    # Fields Writes Management
+    # ====================================================================#
+
+    @staticmethod
+    def set(record, field_id, value):
+        """
+        Set a Record Field Value, Buffered if Enabled
+        :param record: Odoo Record
+        :param field_id: str
+        :param value: mixed
+        :return: bool   False if value is unchanged
+        """
+        # ====================================================================#
+        # Same Value => Skip Write
+        if not WritesBuffer.is_changed(record, field_id, value):
+            WritesBuffer.count("skipped")
+            return False
+        WritesBuffer.count("written")
+        # ====================================================================#
+        # Not Buffered => Direct Write
+        if not WritesBuffer.is_buffered(record, field_id):
+            setattr(record, field_id, value)
+            return True
+        # ====================================================================#
+        # Store Change for Record
+        pending = WritesBuffer.get_pending()
+        key = (record._name, record.id)
+        if key not in pending:
+            pending[key] = (record, {})
+        vals = pending[key][1]
+        # ====================================================================#
+        # Relational Commands are Executed in Received Order
+        if field_id in vals and record._fields[field_id].type in ["one2many", "many2many"]:
+            vals[field_id] = list(vals[field_id]) + list(value)
+        else:
+            vals[field_id] = value
+
+        return True
+
+    @staticmethod
+    def get(record, field_id):
+        """
+        Get a Record Field Value, Including Buffered Changes
+        :param record: Odoo Record
+        :param field_id: str
+        :return: mixed
+        """
+        vals = WritesBuffer.get_vals(record)
+        if field_id not in vals:
+            return getattr(record, field_id)
+        field = record._fields[field_id]
+
+        return field.convert_to_record(field.convert_to_cache(vals[field_id], record), record)
+
+    @staticmethod
+    def get_vals(record):
+        """
+        Get Buffered Changes for a Record
+        :param record: Odoo Record
+        :return: dict
+        """
+        pending = WritesBuffer.get_pending()
+        if pending is None or not record.id:
+            return {}
+        return pending.get((record._name, record.id), (record, {}))[1]
+
+    @staticmethod
+    def is_buffered(record, field_id):
+        """
+        Check if a Record Field Change will be Buffered
+        :param record: Odoo Record
+        :param field_id: str
+        :return: bool
+        """
+        if WritesBuffer.get_pending() is None or not record.id or field_id not in record._fields:
+            return False
+
+        return record._fields[field_id].type not in WritesBuffer.direct_types
+
+    # ====================================================================#
+    # Unchanged Values Detection
+    # ====================================================================#
+
+    @staticmethod
+    def is_changed(record, field_id, value):
+        """
+        Check if a Value Differs from Record Current Value, Including Buffered Changes
+        :param record: Odoo Record
+        :param field_id: str
+        :param value: mixed
+        :return: bool
+        """
+        field = record._fields.get(field_id)
+        if field is None or len(record) != 1:
+            return True
+        if field.type in WritesBuffer.direct_types:
+            return WritesBuffer.is_binary_changed(record, field_id, value)
+        try:
+            return not WritesBuffer.is_equal(field, value, WritesBuffer.get(record, field_id))
+        except Exception:
+            return True
+
+    @staticmethod
+    def is_binary_changed(record, field_id, value):
+        """
+        Check if a Binary Value Differs from Record Current Contents, Compared by Md5
+
+        Current contents md5 comes from binary index, so that contents
+        are never loaded only to be compared.
+
+        :param record: Odoo Record
+        :param field_id: str
+        :param value: None, bytes, str   Base64 Encoded Contents
+        :return: bool
+        """
+        from odoo.addons.splashsync.helpers import OddoFilesHelper
+        current_md5 = OddoFilesHelper.get_md5(record, field_id)
+        if not value:
+            return current_md5 is not None
+        if current_md5 is None:
+            return True
+
+        return hashlib.md5(base64.b64decode(value)).hexdigest() != current_md5
+
+    @staticmethod
+    def is_equal(field, value, current):
+        """
+        Compare a Received Value with a Field Current Value, Normalized by Field Type
+        :param field: Odoo Field
+        :param value: mixed     Received Value
+        :param current: mixed   Current Value, as Read on Record
+        :return: bool
+        """
+        if field.type == "many2one":
+            if isinstance(value, models.BaseModel):
+                value = value.id
+            return (int(value) if value else False) == (current.id or False)
+        if field.type in ["many2many", "one2many"]:
+            return WritesBuffer.apply_commands(current.ids, value) == set(current.ids)
+        if field.type == "boolean":
+            return bool(value) == bool(current)
+        if field.type in ["char", "text", "html", "selection"]:
+            return (str(value) if value else False) == (str(current) if current else False)
+        if field.type == "integer":
+            return int(value or 0) == int(current or 0)
+        if field.type in ["float", "monetary"]:
+            digits = field.digits if field.type == "float" else None
+            if digits:
+                return float_compare(float(value or 0), float(current or 0), precision_digits=digits[1]) == 0
+            return float(value or 0) == float(current or 0)
+        if field.type == "date":
+            return fields.Date.to_date(value or None) == fields.Date.to_date(current or None)
+        if field.type == "datetime":
+            return fields.Datetime.to_datetime(value or None) == fields.Datetime.to_datetime(current or None)
+
+        return value == current
+
+    @staticmethod
+    def apply_commands(ids, commands):
+        """
+        Compute Related Ids after Relational Commands, None if Commands Create or Update Records
+        :param ids: list
+        :param commands: list
+        :return: None|set
+        """
+        ids = set(ids)
+        for command in commands:
+            if not isinstance(command, (list, tuple)) or len(command) < 1:
+                return None
+            if command[0] == 6:
+                ids = set(command[2])
+            elif command[0] == 5:
+                ids = set()
+            elif command[0] == 4:
+                ids.add(command[1])
+            elif command[0] in [2, 3]:
+                ids.discard(command[1])
+            else:
+                return None
+
+        return ids
+
+    # ====================================================================#
+    # Writes Counters
+    # ====================================================================#
+
+    @staticmethod
+    def count(key, value=1):
+        """
+        Increment a Writes Counter, Only Counted from Buffering Start until Reset
+        :param key: str     written|skipped
+        :param value: int
+        :return: void
+        """
+        stats = getattr(WritesBuffer.__local__, "stats", None)
+        if stats is None:
+            return
+        stats[key] = stats.get(key, 0) + value
+
+    @staticmethod
+    def get_stats():
+        """
+        Get Writes Counters since Last Buffering Start
+        :return: dict
+        """
+        return dict(getattr(WritesBuffer.__local__, "stats", None) or {"written": 0, "skipped": 0})
+
+    # ====================================================================#
+    # Buffer Management
+    # ====================================================================#
+
+    @staticmethod
+    def get_pending():
+        """
+        Get Buffered Writes of Current Thread
+        :return: None, OrderedDict
+        """
+        return getattr(WritesBuffer.__local__, "pending", None)
+
+    @staticmethod
+    def buffer():
+        """Start Buffering Fields Writes & Reset Counters"""
+        WritesBuffer.__local__.pending = OrderedDict()
+        WritesBuffer.__local__.stats = {"written": 0, "skipped": 0}
+
+    @staticmethod
+    def flush():
+        """
+        Execute Buffered Writes, a Single write() per Record
+        :return: bool
+        """
+        pending = WritesBuffer.get_pending()
+        WritesBuffer.__local__.pending = None
+        if not pending:
+            return True
+        try:
+            for record, vals in pending.values():
+                if len(vals):
+                    record.write(vals)
+        except Exception as exception:
+            return Framework.log().fromException(exception)
+
+        return True
+
+    @staticmethod
+    def reset():
+        """Forget Buffered Writes & Counters"""
+        WritesBuffer.__local__.pending = None
+        WritesBuffer.__local__.stats = None
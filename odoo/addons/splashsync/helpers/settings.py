@@ -12,12 +12,14 @@
 #  file that was distributed with this source code.
 #
 
+import threading
 from odoo.http import request
 
 
 class SettingsManager():
 
-    __settings__ = None
+    # Loaded Configuration, per Thread (i.e: per Request or Scheduled Action)
+    __local__ = threading.local()
 
     # Default Settings
     __default__ = {
@@ -29,6 +31,10 @@ class SettingsManager():
         'splash_product_simplified_prices': False,
         'splash_product_advanced_variants': False,
         'splash_product_advanced_taxes': False,
+        'splash_list_estimated_totals': False,
+        'splash_product_deferred_images': False,
+        'splash_commit_window': 60,
+        'splash_commit_batch_size': 50,
     }
 
     @staticmethod
@@ -64,6 +70,22 @@ class SettingsManager():
     def is_prd_adv_taxes():
         return bool(SettingsManager.get_configuration()["splash_product_advanced_taxes"])
 
+    @staticmethod
+    def is_list_estimated():
+        return bool(SettingsManager.get_configuration()["splash_list_estimated_totals"])
+
+    @staticmethod
+    def is_prd_deferred_images():
+        return bool(SettingsManager.get_configuration()["splash_product_deferred_images"])
+
+    @staticmethod
+    def get_commit_window():
+        return max(int(SettingsManager.get_configuration()["splash_commit_window"] or 0), 0)
+
+    @staticmethod
+    def get_commit_batch_size():
+        return max(int(SettingsManager.get_configuration()["splash_commit_batch_size"] or 0), 1)
+
     @staticmethod
     def get_company_id():
         """Get Requested Company Id"""
@@ -79,21 +101,51 @@ class SettingsManager():
         """Get Company Configuration"""
         # ====================================================================#
         # Already Done
-        if isinstance(SettingsManager.__settings__, dict):
-            return SettingsManager.__settings__
+        settings = getattr(SettingsManager.__local__, "settings", None)
+        if isinstance(settings, dict):
+            return settings
         # ====================================================================#
         # Load Splash Configuration For Company
         company_id = SettingsManager.get_company_id()
+        SettingsManager.__local__.settings = SettingsManager.__load(request.env, company_id)
+
+        return SettingsManager.__local__.settings
+
+    @staticmethod
+    def boot(env, company_id=1):
+        """
+        Load Company Configuration Outside of Http Requests (i.e: Scheduled Actions)
+        :param env: Odoo Environment
+        :param company_id: int
+        :return: dict
+        """
+        SettingsManager.__local__.settings = SettingsManager.__load(env, company_id)
+
+        return SettingsManager.__local__.settings
+
+    @staticmethod
+    def __load(env, company_id):
+        """
+        Load Company Configuration
+        :param env: Odoo Environment
+        :param company_id: int
+        :return: dict
+        """
         # ====================================================================#
         # First/Default Company => Take Params from Core Config
         if company_id == 1:
-            SettingsManager.__settings__ = SettingsManager.__get_core_config()
+            return SettingsManager.__get_core_config(env)
         # ====================================================================#
         # Other Companies => Take params from Company Config
-        else:
-            SettingsManager.__settings__ = SettingsManager.__get_company_config()
+        return SettingsManager.__get_company_config(env, company_id)
 
-        return SettingsManager.__settings__
+    @staticmethod
+    def get_objects_configuration():
+        """Get Company Configuration that Impact Objects (Without Webservice Credentials)"""
+        return {
+            key: value for key, value in SettingsManager.get_configuration().items()
+            if not key.startswith("splash_ws_")
+        }
 
     @staticmethod
     def ensure_company():
@@ -104,18 +156,20 @@ class SettingsManager():
 
     @staticmethod
     def reset():
-        SettingsManager.__settings__ = None
+        SettingsManager.__local__.settings = None
 
     @staticmethod
-    def __get_company_config():
+    def __get_company_config(env, company_id):
         """
         Get Company Configuration
+        :param env: Odoo Environment
+        :param company_id: int
         :return: None, dict
         """
         # ====================================================================#
         # Load Company Configuration
-        settings = request.env['res.config.settings'].search(
-            [('company_id', '=', SettingsManager.get_company_id())],
+        settings = env['res.config.settings'].search(
+            [('company_id', '=', company_id)],
             limit=1
         )
         if len(settings) != 1:
@@ -126,14 +180,15 @@ class SettingsManager():
         return settings.get_values()
 
     @staticmethod
-    def __get_core_config():
+    def __get_core_config(env):
         """
         Get Configuration from Core Parameters
+        :param env: Odoo Environment
         :return: None, dict
         """
         # ====================================================================#
         # Load Core Configuration
-        parameters = request.env['ir.config_parameter'].sudo()
+        parameters = env['ir.config_parameter'].sudo()
         defaults = SettingsManager.__default__
         # ====================================================================#
         # Build Configuration
@@ -146,4 +201,12 @@ class SettingsManager():
             "splash_product_simplified_prices": bool(parameters.get_param('splash_product_simplified_prices', False)),
             "splash_product_advanced_taxes": bool(parameters.get_param('splash_product_advanced_taxes', False)),
             "splash_product_advanced_variants": bool(parameters.get_param('splash_product_advanced_variants', False)),
+            "splash_list_estimated_totals": bool(parameters.get_param('splash_list_estimated_totals', False)),
+            "splash_product_deferred_images": bool(parameters.get_param('splash_product_deferred_images', False)),
+            "splash_commit_window": int(parameters.get_param(
+                'splash_commit_window', defaults['splash_commit_window']
+            )),
+            "splash_commit_batch_size": int(parameters.get_param(
+                'splash_commit_batch_size', defaults['splash_commit_batch_size']
+            )),
         }
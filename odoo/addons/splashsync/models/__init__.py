@@ -13,7 +13,14 @@
 #
 
 from . import authentification
+from . import binary_index
+from . import caches
 from . import configuration
+from . import fields_cache
+from . import image_queue
+from . import outbox
+from . import outbox_stat
 from . import product
 from . import product_template
+from . import product_attribute
 
@@ -37,8 +37,9 @@ class IrHttp(models.AbstractModel):
         request.uid = SUPERUSER_ID
         # ====================================================================#
         # Setup Splash User
-        from odoo.addons.splashsync.helpers import SettingsManager
+        from odoo.addons.splashsync.helpers import SettingsManager, WritesBuffer
         SettingsManager.reset()
+        WritesBuffer.reset()
         splash_user = SettingsManager.get_user()
         if splash_user is None:
             raise exceptions.AccessDenied()
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import base64
+import hashlib
+import imghdr
+from odoo import api, models, fields
+from odoo.tools.mimetypes import guess_mimetype
+
+
+class SplashBinaryIndex(models.Model):
+    """
+    Stored Metadata of Odoo Binary Fields
+
+    Metadata are attached to the checksum of the ir.attachment storing
+    the field contents, so an entry is only used while the attachment
+    is unchanged. Binary fields not stored as attachments are not indexed.
+    """
+    _name = 'splash.binary.index'
+    _description = 'Splash Binary Fields Metadata Index'
+
+    res_model = fields.Char(required=True, index=True, string="Model")
+    res_id = fields.Integer(required=True, index=True, string="Record Id")
+    res_field = fields.Char(required=True, string="Field")
+    checksum = fields.Char(string="Attachment Checksum")
+    md5 = fields.Char(index=True, string="Md5")
+    size = fields.Integer(string="Size")
+    mimetype = fields.Char(string="Mime Type")
+    extension = fields.Char(string="Image Extension")
+    width = fields.Integer(string="Image Width")
+    height = fields.Integer(string="Image Height")
+
+    _sql_constraints = [
+        ('binary_uniq', 'unique(res_model, res_id, res_field)', 'Binary field metadata must be unique!'),
+    ]
+
+    # Metadata Columns
+    __metadata__ = ["md5", "size", "mimetype", "extension", "width", "height"]
+
+    @api.model
+    def get_metadata(self, res_model, res_field, res_ids):
+        """
+        Load Up to Date Metadata of Records Binary Field, in a Single Query
+        :param res_model: str
+        :param res_field: str
+        :param res_ids: list
+        :return: dict   res_id => metadata
+        """
+        if not len(res_ids):
+            return {}
+        self.env.cr.execute("""
+            SELECT i.res_id, i.md5, i.size, i.mimetype, i.extension, i.width, i.height
+            FROM splash_binary_index i
+            JOIN ir_attachment a ON a.res_model = i.res_model AND a.res_id = i.res_id
+                AND a.res_field = i.res_field AND a.checksum = i.checksum
+            WHERE i.res_model = %s AND i.res_field = %s AND i.res_id IN %s
+        """, (res_model, res_field, tuple(res_ids)))
+        results = {}
+        for row in self.env.cr.fetchall():
+            results[row[0]] = dict(zip(self.__metadata__, row[1:]))
+
+        return results
+
+    @api.model
+    def find_by_md5(self, md5_list):
+        """
+        Find Up to Date Attachments Storing Given Contents, in a Single Query
+        :param md5_list: list
+        :return: dict   md5 => ir.attachment id
+        """
+        if not len(md5_list):
+            return {}
+        self.env.cr.execute("""
+            SELECT DISTINCT ON (i.md5) i.md5, a.id
+            FROM splash_binary_index i
+            JOIN ir_attachment a ON a.res_model = i.res_model AND a.res_id = i.res_id
+                AND a.res_field = i.res_field AND a.checksum = i.checksum
+            WHERE i.md5 IN %s
+            ORDER BY i.md5, a.id
+        """, (tuple(md5_list),))
+
+        return dict(self.env.cr.fetchall())
+
+    @api.model
+    def update_metadata(self, record, res_field, b64_contents=None):
+        """
+        Compute Metadata of a Record Binary Field & Store it if Indexable
+        :param record: Odoo Record
+        :param res_field: str
+        :param b64_contents: None, bytes    Field Contents, Loaded if None
+        :return: None, dict
+        """
+        if b64_contents is None:
+            b64_contents = getattr(record.with_context(bin_size=False), res_field)
+        if not isinstance(b64_contents, (bytes, str)):
+            return None
+        metadata = self.compute_metadata(base64.b64decode(b64_contents))
+        # ====================================================================#
+        # Only Attachments Contents Changes are Detected
+        attachment = self.env['ir.attachment'].sudo().search_read([
+            ('res_model', '=', record._name),
+            ('res_field', '=', res_field),
+            ('res_id', '=', record.id),
+        ], ['checksum'], limit=1)
+        if not len(attachment) or not attachment[0]['checksum']:
+            return metadata
+        # ====================================================================#
+        # Store Metadata
+        values = dict(metadata, checksum=attachment[0]['checksum'])
+        index = self.sudo().search([
+            ('res_model', '=', record._name),
+            ('res_id', '=', record.id),
+            ('res_field', '=', res_field),
+        ], limit=1)
+        if len(index):
+            index.write(values)
+        else:
+            self.sudo().create(dict(values, res_model=record._name, res_id=record.id, res_field=res_field))
+
+        return metadata
+
+    @api.model
+    def compute_metadata(self, raw_contents):
+        """
+        Compute Metadata from Raw File Contents
+        :param raw_contents: bytes
+        :return: dict
+        """
+        extension = imghdr.what(None, h=raw_contents)
+        width, height = 0, 0
+        if extension is not None:
+            try:
+                from splashpy.helpers import ImagesHelper
+                width, height = ImagesHelper.get_pil_dims(raw_contents)
+            except Exception:
+                width, height = 0, 0
+
+        return {
+            "md5": hashlib.md5(raw_contents).hexdigest(),
+            "size": len(raw_contents),
+            "mimetype": guess_mimetype(raw_contents),
+            "extension": extension,
+            "width": width,
+            "height": height,
+        }
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+from odoo import api, models
+
+
+class SplashCacheMixin(models.AbstractModel):
+    """Notify Splash Caches of Changes on Models they are Built from"""
+    _name = 'splash.cache.mixin'
+    _description = 'Splash Cached Model'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super(SplashCacheMixin, self).create(vals_list)
+        # ====================================================================#
+        # Notify Splash Caches
+        from odoo.addons.splashsync.helpers import CacheManager
+        CacheManager.notify(self)
+
+        return records
+
+    def write(self, vals):
+        res = super(SplashCacheMixin, self).write(vals)
+        # ====================================================================#
+        # Notify Splash Caches
+        from odoo.addons.splashsync.helpers import CacheManager
+        CacheManager.notify(self)
+
+        return res
+
+    def unlink(self):
+        res = super(SplashCacheMixin, self).unlink()
+        # ====================================================================#
+        # Notify Splash Caches
+        from odoo.addons.splashsync.helpers import CacheManager
+        CacheManager.notify(self)
+
+        return res
+
+
+class ProductCategory(models.Model):
+    """Override for Odoo Products Categories to Keep Splash Caches Current"""
+    _name = 'product.category'
+    _inherit = ['product.category', 'splash.cache.mixin']
+
+
+class ResCompany(models.Model):
+    """Override for Odoo Companies to Keep Splash Caches Current"""
+    _name = 'res.company'
+    _inherit = ['res.company', 'splash.cache.mixin']
+
+
+class ResCurrency(models.Model):
+    """Override for Odoo Currencies to Keep Splash Caches Current"""
+    _name = 'res.currency'
+    _inherit = ['res.currency', 'splash.cache.mixin']
@@ -71,6 +71,34 @@ class ResConfigSettings(models.TransientModel):
         help="Enable to store Products Features on features_value_ids instead of Template attribute_line_ids."
     )
 
+    splash_list_estimated_totals = fields.Boolean(
+        company_dependent=True,
+        string="Estimated Lists Totals",
+        default=False,
+        help="Use Postgres statistics to estimate Objects Lists totals instead of counting all records."
+    )
+
+    splash_product_deferred_images = fields.Boolean(
+        company_dependent=True,
+        string="Deferred Images Ingestion",
+        default=False,
+        help="Queue received products images and download them in background."
+    )
+
+    splash_commit_window = fields.Integer(
+        company_dependent=True,
+        string="Commits Coalescing Window",
+        default=60,
+        help="Delay in seconds without new changes before an Object changes are merged & committed to Splash."
+    )
+
+    splash_commit_batch_size = fields.Integer(
+        company_dependent=True,
+        string="Commits Batch Size",
+        default=50,
+        help="Max Number of Objects Ids sent in a single Commit to Splash."
+    )
+
     def get_values(self):
         res = super(ResConfigSettings, self).get_values()
         # Load Current Company Configuration
@@ -85,6 +113,10 @@ class ResConfigSettings(models.TransientModel):
             splash_product_simplified_prices=bool(config.splash_product_simplified_prices),
             splash_product_advanced_taxes=bool(config.splash_product_advanced_taxes),
             splash_product_advanced_variants=bool(config.splash_product_advanced_variants),
+            splash_list_estimated_totals=bool(config.splash_list_estimated_totals),
+            splash_product_deferred_images=bool(config.splash_product_deferred_images),
+            splash_commit_window=int(config.splash_commit_window),
+            splash_commit_batch_size=int(config.splash_commit_batch_size),
         )
         return res
 
@@ -103,8 +135,17 @@ class ResConfigSettings(models.TransientModel):
             'splash_product_simplified_prices': self.splash_product_simplified_prices,
             'splash_product_advanced_taxes': self.splash_product_advanced_taxes,
             'splash_product_advanced_variants': self.splash_product_advanced_variants,
+            'splash_list_estimated_totals': self.splash_list_estimated_totals,
+            'splash_product_deferred_images': self.splash_product_deferred_images,
+            'splash_commit_window': self.splash_commit_window,
+            'splash_commit_batch_size': self.splash_commit_batch_size,
         })
         # ====================================================================#
+        # Settings Changed => Drop Fields Descriptions & Splash Servers
+        self.env['splash.fields.cache'].invalidate()
+        from odoo.addons.splashsync.controllers.main import Webservice
+        Webservice.reset()
+        # ====================================================================#
         # Default Company => Copy Configuration to Main Parameters
         if self.env.user.company_id.id == 1:
             self.env['ir.config_parameter'].sudo().set_param('splash_ws_id', self.splash_ws_id)
@@ -115,6 +156,10 @@ class ResConfigSettings(models.TransientModel):
             self.env['ir.config_parameter'].sudo().set_param('splash_product_simplified_prices', self.splash_product_simplified_prices)
             self.env['ir.config_parameter'].sudo().set_param('splash_product_advanced_taxes', self.splash_product_advanced_taxes)
             self.env['ir.config_parameter'].sudo().set_param('splash_product_advanced_variants', self.splash_product_advanced_variants)
+            self.env['ir.config_parameter'].sudo().set_param('splash_list_estimated_totals', self.splash_list_estimated_totals)
+            self.env['ir.config_parameter'].sudo().set_param('splash_product_deferred_images', self.splash_product_deferred_images)
+            self.env['ir.config_parameter'].sudo().set_param('splash_commit_window', self.splash_commit_window)
+            self.env['ir.config_parameter'].sudo().set_param('splash_commit_batch_size', self.splash_commit_batch_size)
 
     @staticmethod
     def get_base_url():
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import json
+from odoo import api, models, fields
+
+
+class SplashFieldsCache(models.Model):
+    """Persisted Cache of Splash Objects Fields Descriptions"""
+    _name = 'splash.fields.cache'
+    _description = 'Splash Fields Description Cache'
+
+    object_type = fields.Char(
+        required=True,
+        index=True,
+        string="Object Type"
+    )
+    company_id = fields.Many2one(
+        comodel_name="res.company",
+        ondelete="cascade",
+        index=True,
+        string="Company"
+    )
+    version = fields.Char(
+        required=True,
+        index=True,
+        string="Version Hash",
+        help="Hash of Settings, Languages & Modules used to build this Description"
+    )
+    data = fields.Text(
+        string="Fields Description (JSON)"
+    )
+
+    @api.model
+    def load(self, object_type, company_id, version):
+        """
+        Load a Stored Fields Description
+        :param object_type: str
+        :param company_id: int
+        :param version: str
+        :return: None|list
+        """
+        cache = self.sudo().search([
+            ('object_type', '=', object_type),
+            ('company_id', '=', company_id),
+            ('version', '=', version),
+        ], limit=1)
+        if len(cache) != 1:
+            return None
+        try:
+            return json.loads(cache.data)
+        except Exception:
+            return None
+
+    @api.model
+    def store(self, object_type, company_id, version, description):
+        """
+        Store a Fields Description, Replacing Previous Versions
+        :param object_type: str
+        :param company_id: int
+        :param version: str
+        :param description: list
+        :return: void
+        """
+        self.sudo().search([
+            ('object_type', '=', object_type),
+            ('company_id', '=', company_id),
+        ]).unlink()
+        self.sudo().create({
+            'object_type': object_type,
+            'company_id': company_id,
+            'version': version,
+            'data': json.dumps(description, default=str),
+        })
+
+    @api.model
+    def invalidate(self):
+        """Drop All Stored Fields Descriptions"""
+        self.sudo().search([]).unlink()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import logging
+from odoo import api, models, fields
+
+
+class SplashImageQueue(models.Model):
+    """Pending Images to Download from Splash Server & Attach to Records"""
+    _name = 'splash.image.queue'
+    _description = 'Splash Deferred Images Queue'
+    _order = 'id'
+
+    res_model = fields.Char(required=True, string="Model")
+    res_id = fields.Integer(required=True, index=True, string="Record Id")
+    res_field = fields.Char(required=True, string="Field")
+    position = fields.Integer(string="Position", default=0)
+    md5 = fields.Char(required=True, string="Md5")
+    path = fields.Char(required=True, string="Remote Path")
+    company_id = fields.Integer(required=True, default=1, string="Splash Company Id")
+    state = fields.Selection(
+        [('pending', 'Pending'), ('failed', 'Failed')],
+        required=True,
+        default='pending',
+        index=True,
+        string="State"
+    )
+    attempts = fields.Integer(string="Attempts", default=0)
+    last_error = fields.Char(string="Last Error")
+
+    # Max Number of Download Attempts before Failure
+    max_attempts = 5
+
+    @api.model
+    def enqueue(self, target, field_id, field_data, position=0, company_id=1):
+        """
+        Queue an Image for a Record Field, Replacing Pending Ones
+        :param target: Odoo Record
+        :param field_id: str
+        :param field_data: dict     Splash Image Field Data
+        :param position: int
+        :param company_id: int
+        :return: void
+        """
+        from odoo.addons.splashsync.helpers import FilesDownloader
+        self.cancel(target, field_id)
+        self.sudo().create({
+            'res_model': target._name,
+            'res_id': target.id,
+            'res_field': field_id,
+            'position': position if isinstance(position, int) else 0,
+            'md5': field_data['md5'],
+            'path': FilesDownloader.get_path(field_data),
+            'company_id': company_id,
+        })
+
+    @api.model
+    def cancel(self, target, field_id):
+        """
+        Forget Queued Images for a Record Field
+        :param target: Odoo Record
+        :param field_id: str
+        :return: void
+        """
+        self.sudo().search([
+            ('res_model', '=', target._name),
+            ('res_id', '=', target.id),
+            ('res_field', '=', field_id),
+        ]).unlink()
+
+    @api.model
+    def _cron_ingest(self, limit=50):
+        """
+        Download & Attach Queued Images, by Batches
+        :param limit: int   Max Number of Images per Run
+        :return: void
+        """
+        from odoo.addons.splashsync.helpers import FrameworkHelper
+        jobs = self.sudo().search([('state', '=', 'pending')], limit=limit)
+        for company_id in set(jobs.mapped('company_id')):
+            try:
+                with FrameworkHelper.boot(self.env, company_id):
+                    self._ingest(jobs.filtered(lambda j: j.company_id == company_id))
+            except Exception as exception:
+                self.env.cr.rollback()
+                logging.getLogger("SPLASH SYNC").warning(
+                    "Deferred Images Failed for Company " + str(company_id) + ": " + str(exception)
+                )
+
+    @api.model
+    def _ingest(self, jobs):
+        """
+        Download & Attach Queued Images, with Splash Booted for their Company
+        :param jobs: splash.image.queue
+        :return: void
+        """
+        from odoo.addons.splashsync.helpers import FilesDownloader
+        # ====================================================================#
+        # Download All Images in Parallel
+        files = [{'md5': job.md5, 'file': job.path, 'path': job.path} for job in jobs]
+        FilesDownloader.prefetch(files)
+        for job, file_data in zip(jobs, files):
+            try:
+                target = self.env[job.res_model].sudo().browse([job.res_id]).exists()
+                if not target:
+                    job.unlink()
+                    continue
+                new_file = FilesDownloader.get(file_data)
+                if not isinstance(new_file, dict) or "raw" not in new_file:
+                    raise ValueError("Unable to read file from Server")
+                # ====================================================================#
+                # Attach Image & Update Metadata Index, Received from Splash => No Commit
+                target.with_context(splash_no_commit=True).write({job.res_field: new_file["raw"]})
+                self.env['splash.binary.index'].update_metadata(target, job.res_field, new_file["raw"])
+                job.unlink()
+            except Exception as exception:
+                self.env.cr.rollback()
+                self._add_attempt(job, exception)
+                logging.getLogger("SPLASH SYNC").warning("Deferred Image Failed: " + str(exception))
+            self.env.cr.commit()
+        FilesDownloader.reset()
+
+    @api.model
+    def _add_attempt(self, job, exception):
+        """
+        Count a Failed Download Attempt, in Database as Cached Values are Outdated after Rollback
+        :param job: splash.image.queue
+        :param exception: Exception
+        :return: void
+        """
+        self.env.cr.execute(
+            "UPDATE splash_image_queue SET attempts = attempts + 1, last_error = %s,"
+            " state = CASE WHEN attempts + 1 >= %s THEN 'failed' ELSE 'pending' END"
+            " WHERE id = %s",
+            (str(exception)[:250], self.max_attempts, job.id)
+        )
+        job.invalidate_cache(['attempts', 'last_error', 'state'], job.ids)
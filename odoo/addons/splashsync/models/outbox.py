@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import logging
+from datetime import timedelta
+from odoo import api, models, fields, http
+
+
+class SplashOutbox(models.Model):
+    """Local Changes to Commit to Splash Server, Filled in User Transaction"""
+    _name = 'splash.outbox'
+    _description = 'Splash Changes Outbox'
+    _order = 'id'
+
+    res_model = fields.Char(required=True, string="Model")
+    res_id = fields.Integer(required=True, index=True, string="Record Id")
+    action = fields.Selection(
+        [('create', 'Create'), ('update', 'Update'), ('delete', 'Delete')],
+        required=True,
+        string="Action"
+    )
+    changed_fields = fields.Char(string="Changed Fields")
+    date = fields.Datetime(required=True, default=fields.Datetime.now, string="Date")
+    company_id = fields.Integer(required=True, default=1, string="Splash Company Id")
+    state = fields.Selection(
+        [('pending', 'Pending'), ('failed', 'Failed')],
+        required=True,
+        default='pending',
+        index=True,
+        string="State"
+    )
+    attempts = fields.Integer(string="Attempts", default=0)
+    last_error = fields.Char(string="Last Error")
+
+    # Splash Objects Types by Odoo Model
+    object_types = {'product.product': 'Product'}
+
+    # Max Coalescing Delay for Continuously Changed Objects, in Windows
+    max_windows = 5
+
+    # Max Number of Commit Attempts before Failure
+    max_attempts = 5
+
+    # Prefixes of Odoo Technical Fields, Never Mapped by Splash
+    ignored_prefixes = ('message_', 'activity_', 'website_message_', 'rating_')
+
+    @api.model
+    def register(self, records, action, changed_fields=None):
+        """
+        Queue Changes of Records for Commit to Splash
+
+        Nothing is queued for changes done by Splash itself, i.e: Splash
+        requests or writes done with 'splash_no_commit' context, nor for
+        updates of fields Splash doesn't map.
+
+        :param records: Odoo Records
+        :param action: str      create|update|delete
+        :param changed_fields: None|list
+        :return: void
+        """
+        if not records or self.env.context.get('splash_no_commit') or self.is_splash_request():
+            return
+        if changed_fields is not None:
+            changed_fields = self.get_mapped_fields(records, changed_fields)
+            if not changed_fields:
+                return
+        self.sudo().create([{
+            'res_model': records._name,
+            'res_id': record_id,
+            'action': action,
+            'changed_fields': ",".join(sorted(changed_fields)) if changed_fields else False,
+            'company_id': self.env.user.company_id.id or 1,
+        } for record_id in records.ids])
+
+    @api.model
+    def get_mapped_fields(self, records, field_ids):
+        """
+        Filter Changed Fields on Fields Splash May Map, i.e: Not Technical Fields
+        :param records: Odoo Records
+        :param field_ids: list
+        :return: list
+        """
+        ignored = set(models.MAGIC_COLUMNS + [models.BaseModel.CONCURRENCY_CHECK_FIELD])
+        return [
+            field_id for field_id in field_ids
+            if field_id in records._fields and field_id not in ignored
+            and not field_id.startswith(self.ignored_prefixes)
+        ]
+
+    @staticmethod
+    def is_splash_request():
+        """
+        Check if Changes are Done by Splash Server itself => No Commit Needed
+        :return: bool
+        """
+        try:
+            return bool(http.request) and http.request.httprequest.path == '/splash'
+        except Exception:
+            return False
+
+    @api.model
+    def _cron_dispatch(self, limit=5000):
+        """
+        Send Queued Changes to Splash, by Batches
+        :param limit: int   Max Number of Objects per Company & Run
+        :return: void
+        """
+        from odoo.addons.splashsync.helpers import FrameworkHelper, SettingsManager
+        self.env.cr.execute("SELECT DISTINCT company_id FROM splash_outbox WHERE state = 'pending'")
+        for company_id in [row[0] for row in self.env.cr.fetchall()]:
+            try:
+                with FrameworkHelper.boot(self.env, company_id):
+                    events = self._get_ready_events(company_id, SettingsManager.get_commit_window(), limit)
+                    self._dispatch(events, company_id)
+            except Exception as exception:
+                self.env.cr.rollback()
+                logging.getLogger("SPLASH SYNC").warning(
+                    "Splash Commits Failed for Company " + str(company_id) + ": " + str(exception)
+                )
+
+    @api.model
+    def _get_ready_events(self, company_id, window, limit):
+        """
+        Load All Pending Changes of Objects Ready for Commit, Selected in Database
+
+        Changes are merged until object wasn't changed for a full window.
+        Continuously changed objects are committed after max_windows.
+
+        :param company_id: int
+        :param window: int      Coalescing Window in Seconds
+        :param limit: int       Max Number of Objects
+        :return: splash.outbox
+        """
+        now = fields.Datetime.now()
+        window = max(window, 0)
+        self.env.cr.execute(
+            "SELECT res_model, res_id FROM splash_outbox"
+            " WHERE state = 'pending' AND company_id = %s"
+            " GROUP BY res_model, res_id"
+            " HAVING max(date) <= %s OR min(date) <= %s"
+            " ORDER BY min(id) LIMIT %s",
+            (company_id, now - timedelta(seconds=window), now - timedelta(seconds=window * self.max_windows), limit)
+        )
+        objects = self.env.cr.fetchall()
+        if not objects:
+            return self.browse()
+        self.env.cr.execute(
+            "SELECT id FROM splash_outbox"
+            " WHERE state = 'pending' AND company_id = %s AND (res_model, res_id) IN %s"
+            " ORDER BY id",
+            (company_id, tuple(objects))
+        )
+
+        return self.browse([row[0] for row in self.env.cr.fetchall()])
+
+    @api.model
+    def _dispatch(self, events, company_id):
+        """
+        Merge & Send Queued Changes for a Company, a Commit per Object Type, Action & Batch
+        Splash must be booted for the company, commits are sent with its connection,
+        whatever Splash Framework mode is (i.e: server mode left by webservice requests).
+        :param events: splash.outbox
+        :param company_id: int
+        :return: void
+        """
+        from odoo.addons.splashsync.helpers import FrameworkHelper, SettingsManager
+        connection = FrameworkHelper.get_connection()
+        batch_size = SettingsManager.get_commit_batch_size()
+        stats = {"events": 0, "merged": 0, "dropped": 0, "objects": 0, "commits": 0}
+        # ====================================================================#
+        # Merge Changes of Each Object, Grouped by Object Type & Action
+        groups = {}
+        for (res_model, res_id), object_events in self._group_by_object(events).items():
+            object_type = self.object_types.get(res_model)
+            if object_type is None:
+                object_events.unlink()
+                continue
+            action = self.merge_actions(object_events.mapped('action'))
+            stats["events"] += len(object_events)
+            # Object Created & Deleted in Window => Nothing to Commit
+            if action is None:
+                stats["dropped"] += len(object_events)
+                object_events.unlink()
+                continue
+            stats["merged"] += len(object_events) - 1
+            stats["objects"] += 1
+            groups.setdefault((object_type, action), []).append((res_id, object_events))
+        # ====================================================================#
+        # Commit Changes by Batches
+        for (object_type, action), objects in groups.items():
+            for index in range(0, len(objects), batch_size):
+                batch = objects[index:index + batch_size]
+                batch_events = self.browse([event.id for res_id, object_events in batch for event in object_events])
+                try:
+                    object_ids = [str(res_id) for res_id, object_events in batch]
+                    if not FrameworkHelper.commit(connection, object_type, object_ids, action, "Odoo", "Odoo Changes"):
+                        raise ValueError("Splash Commit Failed")
+                    batch_events.unlink()
+                    stats["commits"] += 1
+                except Exception as exception:
+                    self._add_attempt(batch_events, exception)
+                    logging.getLogger("SPLASH SYNC").warning("Splash Commit Failed: " + str(exception))
+                self.env.cr.commit()
+        # ====================================================================#
+        # Update Coalescing Metrics
+        self._add_stats(company_id, stats)
+        self.env.cr.commit()
+
+    @api.model
+    def _add_attempt(self, events, exception):
+        """
+        Count a Failed Commit Attempt, in Database
+        :param events: splash.outbox
+        :param exception: Exception
+        :return: void
+        """
+        if not events:
+            return
+        self.env.cr.execute(
+            "UPDATE splash_outbox SET attempts = attempts + 1, last_error = %s,"
+            " state = CASE WHEN attempts + 1 >= %s THEN 'failed' ELSE 'pending' END"
+            " WHERE id IN %s",
+            (str(exception)[:250], self.max_attempts, tuple(events.ids))
+        )
+        events.invalidate_cache(['attempts', 'last_error', 'state'], events.ids)
+
+    @staticmethod
+    def _group_by_object(events):
+        """
+        Group Queued Changes by Object, in Received Order
+        :param events: splash.outbox
+        :return: dict
+        """
+        objects = {}
+        for event in events.sorted(key=lambda e: e.id):
+            key = (event.res_model, event.res_id)
+            objects[key] = objects[key] | event if key in objects else event
+
+        return objects
+
+    @staticmethod
+    def merge_actions(actions):
+        """
+        Merge Successive Actions on an Object into a Single One
+
+            - create + update => create
+            - update + delete => delete
+            - create + delete => None, nothing to commit
+
+        :param actions: list    Actions in Received Order
+        :return: None|str
+        """
+        merged = None
+        created = False
+        for action in actions:
+            if action == 'create':
+                created = True
+                merged = 'create'
+            elif action == 'update':
+                merged = merged or 'update'
+            elif action == 'delete':
+                merged = None if created else 'delete'
+
+        return merged
+
+    # ====================================================================#
+    # Coalescing Metrics
+    # ====================================================================#
+
+    @api.model
+    def get_stats(self, company_id=None):
+        """
+        Get Outbox Metrics since Installation
+
+            - events:   queued changes processed
+            - merged:   changes merged into another one
+            - dropped:  changes of objects created & deleted in window
+            - objects:  objects committed
+            - commits:  commit requests sent
+
+        :param company_id: None, int
+        :return: dict
+        """
+        return self.env['splash.outbox.stat'].sudo().get_totals(company_id)
+
+    @api.model
+    def _add_stats(self, company_id, stats):
+        """
+        Add a Dispatch Metrics to Outbox Metrics
+        :param company_id: int
+        :param stats: dict
+        :return: void
+        """
+        if not stats["events"]:
+            return
+        self.env['splash.outbox.stat'].sudo().add(company_id, stats)
+        logging.getLogger("SPLASH SYNC").info(
+            "Splash Outbox: {events} changes, {merged} merged, {dropped} dropped, {commits} commits".format(**stats)
+        )
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+from odoo import api, models, fields
+
+
+class SplashOutboxStat(models.Model):
+    """
+    Splash Changes Outbox Coalescing Metrics, per Day & Company
+
+    Counters are incremented in database with a single upsert per
+    dispatch, so that concurrent dispatches never lose metrics.
+    """
+    _name = 'splash.outbox.stat'
+    _description = 'Splash Changes Outbox Metrics'
+    _order = 'day desc, company_id'
+
+    day = fields.Date(required=True, default=fields.Date.context_today, string="Day")
+    company_id = fields.Integer(required=True, default=1, string="Splash Company Id")
+    events = fields.Integer(string="Processed Changes", default=0)
+    merged = fields.Integer(string="Merged Changes", default=0)
+    dropped = fields.Integer(string="Dropped Changes", default=0)
+    objects = fields.Integer(string="Committed Objects", default=0)
+    commits = fields.Integer(string="Commit Requests", default=0)
+
+    _sql_constraints = [
+        ('stat_uniq', 'unique(day, company_id)', 'Outbox metrics must be unique per day & company!'),
+    ]
+
+    # Metrics Columns
+    __metrics__ = ["events", "merged", "dropped", "objects", "commits"]
+
+    @api.model
+    def add(self, company_id, stats):
+        """
+        Add Dispatch Metrics to Company Metrics of the Day
+        :param company_id: int
+        :param stats: dict
+        :return: void
+        """
+        values = [int(stats.get(metric, 0)) for metric in self.__metrics__]
+        self.env.cr.execute(
+            "INSERT INTO splash_outbox_stat (day, company_id, " + ", ".join(self.__metrics__) + ")"
+            " VALUES (%s, %s, " + ", ".join(["%s"] * len(self.__metrics__)) + ")"
+            " ON CONFLICT (day, company_id) DO UPDATE SET " + ", ".join([
+                metric + " = splash_outbox_stat." + metric + " + EXCLUDED." + metric for metric in self.__metrics__
+            ]),
+            [fields.Date.context_today(self), company_id] + values
+        )
+        self.invalidate_cache(self.__metrics__)
+
+    @api.model
+    def get_totals(self, company_id=None):
+        """
+        Sum Metrics of All Days, for a Company or All Companies
+        :param company_id: None, int
+        :return: dict
+        """
+        query = "SELECT " + ", ".join(["COALESCE(SUM(" + metric + "), 0)" for metric in self.__metrics__])
+        query += " FROM splash_outbox_stat"
+        if company_id is not None:
+            self.env.cr.execute(query + " WHERE company_id = %s", (company_id, ))
+        else:
+            self.env.cr.execute(query)
+
+        return dict(zip(self.__metrics__, [int(value) for value in self.env.cr.fetchone()]))
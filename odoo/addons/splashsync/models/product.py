@@ -51,29 +51,52 @@ class ProductProduct(models.Model):
         # Redirect to Odoo Core Action
         super(ProductProduct, self)._compute_product_price_extra()
 
-    @api.model
-    def create(self, vals):
-        res = super(ProductProduct, self).create(vals)
-        # _logger = logging.getLogger("SPLASH SYNC")
-        # _logger.warning("New Product Detected: "+str(res.id))
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super(ProductProduct, self).create(vals_list)
+        # ====================================================================#
+        # Update Splash Products Count Cache
+        from odoo.addons.splashsync.helpers import ListsHelper
+        ListsHelper.count_changed(self.env.cr, self._name, len(res.filtered('active')))
+        # ====================================================================#
+        # Queue Changes for Splash Commit
+        self.env['splash.outbox'].register(res, 'create')
 
         return res
 
     def write(self, vals):
+        # ====================================================================#
+        # Count Archived/Unarchived Products, Before Write
+        delta = 0
+        if 'active' in vals:
+            changed = len(self.filtered(lambda product: product.active != bool(vals['active'])))
+            delta = changed if vals['active'] else -changed
         res = super(ProductProduct, self).write(vals)
         if not self:
             return res
-        # _logger = logging.getLogger("SPLASH SYNC")
-        # _logger.warning("Product Change Detected: "+str(self.id))
+        # ====================================================================#
+        # Update Splash Products Count Cache
+        if delta:
+            from odoo.addons.splashsync.helpers import ListsHelper
+            ListsHelper.count_changed(self.env.cr, self._name, delta)
+        # ====================================================================#
+        # Queue Changes for Splash Commit
+        self.env['splash.outbox'].register(self, 'update', list(vals.keys()))
 
         return res
 
     def unlink(self):
+        count = len(self.filtered('active'))
+        # ====================================================================#
+        # Queue Changes for Splash Commit, while Records Still Exists
+        self.env['splash.outbox'].register(self, 'delete')
         res = super(ProductProduct, self).unlink()
         if not self:
             return res
-        # _logger = logging.getLogger("SPLASH SYNC")
-        # _logger.warning("Product Delete Detected: "+str(self.id))
+        # ====================================================================#
+        # Update Splash Products Count Cache
+        from odoo.addons.splashsync.helpers import ListsHelper
+        ListsHelper.count_changed(self.env.cr, self._name, -count)
 
         return res
 
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+
+from odoo import api, models, tools
+
+
+class ProductAttribute(models.Model):
+    """Override for Odoo Products Attributes to Keep Splash Caches Current"""
+    _inherit = 'product.attribute'
+
+    @api.model_cr
+    def init(self):
+        # ====================================================================#
+        # Case Insensitive Attributes Codes Search Index
+        if not tools.index_exists(self._cr, 'product_attribute_lower_name_index'):
+            tools.create_index(self._cr, 'product_attribute_lower_name_index', self._table, ['lower(name)'])
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        res = super(ProductAttribute, self).create(vals_list)
+        # ====================================================================#
+        # Features List Changed => Drop Fields Descriptions
+        self.env['splash.fields.cache'].invalidate()
+
+        return res
+
+    # Attributes Fields Used by Splash Fields Descriptions
+    described_fields = ['name', 'create_variant']
+
+    def write(self, vals):
+        res = super(ProductAttribute, self).write(vals)
+        # ====================================================================#
+        # Features Names or Types Changed => Drop Fields Descriptions
+        if set(vals.keys()) & set(self.described_fields):
+            self.env['splash.fields.cache'].invalidate()
+
+        return res
+
+    def unlink(self):
+        res = super(ProductAttribute, self).unlink()
+        # ====================================================================#
+        # Features List Changed => Drop Fields Descriptions
+        self.env['splash.fields.cache'].invalidate()
+
+        return res
+
+
+class ProductAttributeValue(models.Model):
+    """Override for Odoo Products Attributes Values to Speed Up Splash Lookups"""
+    _inherit = 'product.attribute.value'
+
+    @api.model_cr
+    def init(self):
+        # ====================================================================#
+        # Case Insensitive Values Search Index, by Attribute
+        if not tools.index_exists(self._cr, 'product_attribute_value_lower_name_index'):
+            tools.create_index(
+                self._cr, 'product_attribute_value_lower_name_index', self._table, ['attribute_id', 'lower(name)']
+            )
@@ -29,3 +29,120 @@ class ProductTemplate(models.Model):
         _logger = logging.getLogger("SPLASH SYNC")
         _logger.warning("Variants Auto-creation is disabled when Splash Module is Active")
         return True
+
+    @api.multi
+    def write(self, vals):
+        res = super(ProductTemplate, self).write(vals)
+        # ====================================================================#
+        # Queue Changes of Template Variants for Splash Commit
+        if self:
+            self.env['splash.outbox'].register(self.mapped('product_variant_ids'), 'update', list(vals.keys()))
+
+        return res
+
+    # ====================================================================#
+    # Splash Bulk Creation
+    # ====================================================================#
+
+    @api.model
+    def splash_create_family(self, template_vals, variants_vals):
+        """
+        Create a Product Template with All its Variants at Once
+
+        Attributes values of all variants are resolved (and created if
+        missing) in one pass, template attribute lines are built once and
+        variants are created with a single multi-records create.
+
+        This is an API for bulk imports done by other modules or scripts.
+        Splash server creates variants one by one, with Product object
+        create & set, so it's not used by Splash webservice requests.
+
+        :param template_vals: dict  Shared Template Values
+        :param variants_vals: list  Variants Values, with an 'attributes' dict (code => value),
+                                    other keys are written on product.product (i.e: default_code)
+        :return: product.product    Created Variants
+        """
+        values = self._splash_resolve_values([variant.get('attributes', {}) for variant in variants_vals])
+        # ====================================================================#
+        # Create Template, Only Created Variants are Committed to Splash
+        template = self.with_context(create_product_product=True, splash_no_commit=True).create(template_vals)
+        # ====================================================================#
+        # Build Variants Values & Template Attribute Lines
+        lines = {}
+        products_vals = []
+        for variant in variants_vals:
+            value_ids = []
+            for code, value in variant.get('attributes', {}).items():
+                attribute_id, value_id = values[(str(code).lower(), str(value).lower())]
+                value_ids += [value_id]
+                lines[attribute_id] = lines.get(attribute_id, [])
+                if value_id not in lines[attribute_id]:
+                    lines[attribute_id] += [value_id]
+            product_vals = {key: val for key, val in variant.items() if key != 'attributes'}
+            product_vals.update(product_tmpl_id=template.id, attribute_value_ids=[(6, 0, value_ids)])
+            products_vals += [product_vals]
+        template.write({'attribute_line_ids': [
+            (0, 0, {'attribute_id': attribute_id, 'value_ids': [(6, 0, value_ids)]})
+            for attribute_id, value_ids in lines.items()
+        ]})
+        # ====================================================================#
+        # Create Variants
+        return self.env['product.product'].with_context(create_product_product=True).create(products_vals)
+
+    @api.model
+    def _splash_resolve_values(self, attributes_list):
+        """
+        Find or Create Variants Attributes & Values, with One Query per Model
+        :param attributes_list: list    List of (code => value) dicts
+        :return: dict                   (lower code, lower value) => (attribute id, value id)
+        """
+        from odoo.addons.splashsync.helpers import AttributesHelper
+        pairs = {}
+        for attributes in attributes_list:
+            for code, value in attributes.items():
+                pairs[(str(code).lower(), str(value).lower())] = (str(code), str(value))
+        if not len(pairs):
+            return {}
+        # ====================================================================#
+        # Find or Create Attributes
+        codes = {lower_code: code for (lower_code, lower_value), (code, value) in pairs.items()}
+        self.env.cr.execute(
+            "SELECT DISTINCT ON (lower(name)) lower(name), id FROM product_attribute"
+            " WHERE lower(name) IN %s AND create_variant NOT IN %s"
+            " ORDER BY lower(name), sequence, id",
+            (tuple(codes.keys()), tuple(AttributesHelper.attr_wnva))
+        )
+        attributes = dict(self.env.cr.fetchall())
+        missing = [lower_code for lower_code in codes.keys() if lower_code not in attributes]
+        created = self.env['product.attribute'].create([
+            {"name": codes[lower_code], "type": "select", "create_variant": "always"} for lower_code in missing
+        ])
+        attributes.update(zip(missing, created.ids))
+        # ====================================================================#
+        # Find or Create Values
+        self.env.cr.execute(
+            "SELECT DISTINCT ON (attribute_id, lower(name)) attribute_id, lower(name), id"
+            " FROM product_attribute_value WHERE attribute_id IN %s AND lower(name) IN %s"
+            " ORDER BY attribute_id, lower(name), sequence, id",
+            (tuple(attributes.values()), tuple(set(lower_value for lower_code, lower_value in pairs.keys())))
+        )
+        values = {(row[0], row[1]): row[2] for row in self.env.cr.fetchall()}
+        missing = [key for key in pairs.keys() if (attributes[key[0]], key[1]) not in values]
+        created = self.env['product.attribute.value'].create([
+            {"name": pairs[key][1], "attribute_id": attributes[key[0]]} for key in missing
+        ])
+        values.update({(attributes[key[0]], key[1]): value_id for key, value_id in zip(missing, created.ids)})
+
+        return {key: (attributes[key[0]], values[(attributes[key[0]], key[1])]) for key in pairs.keys()}
+
+    # ====================================================================#
+    # Splash Maintenance Actions
+    # ====================================================================#
+
+    @api.multi
+    def splash_repair_attribute_lines(self):
+        """Rebuild Attribute Lines of Templates from their Variants Values, Not Committed to Splash"""
+        from odoo.addons.splashsync.helpers import LinesHelper
+        for template in self.with_context(splash_no_commit=True):
+            LinesHelper.repair(template)
+        return True
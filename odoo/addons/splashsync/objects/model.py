@@ -11,16 +11,19 @@
 #  file that was distributed with this source code.
 #
 
+import hashlib
+import json
 from abc import abstractmethod
+from datetime import datetime
 from splashpy.models.object import BaseObject
 from splashpy.models.objects.parser import SimpleFields
-from splashpy import Framework
+from splashpy import const, Framework
 from odoo import http
 from odoo.exceptions import MissingError
-from odoo.addons.splashsync.helpers.objects import BasicFields, BinaryFields, ListsHelper, ObjectConfigurator
+from odoo.addons.splashsync.helpers.objects import BasicFields, BinaryFields, FieldsDispatcher, ListsHelper, ObjectConfigurator
 
 
-class OdooObject(ListsHelper, BinaryFields, BaseObject, SimpleFields, BasicFields):
+class OdooObject(ListsHelper, BinaryFields, FieldsDispatcher, BaseObject, SimpleFields, BasicFields):
 
     configurator = None
 
@@ -56,6 +59,11 @@ class OdooObject(ListsHelper, BinaryFields, BaseObject, SimpleFields, BasicField
     # Odoo ORM Access
     # ====================================================================#
 
+    def reset(self):
+        """Forget Request Dependent Data before Object Reuse"""
+        self.model = None
+        self.object = None
+
     def getModel(self):
         """Get Object Model Class"""
         if self.model is None:
@@ -89,6 +97,16 @@ class OdooObject(ListsHelper, BinaryFields, BaseObject, SimpleFields, BasicField
 
     def update(self, needed):
         """Update Current  Odoo Object"""
+        from odoo.addons.splashsync.helpers import FilesDownloader, TransHelper, WritesBuffer
+        FilesDownloader.reset()
+        if not WritesBuffer.flush():
+            return False
+        if not TransHelper.flush():
+            return False
+        if Framework.isDebugMode():
+            Framework.log().info("Writes: {written} values changed, {skipped} unchanged values skipped".format(
+                **WritesBuffer.get_stats()
+            ))
         if not needed:
             return self.getObjectIdentifier()
         try:
@@ -112,6 +130,85 @@ class OdooObject(ListsHelper, BinaryFields, BaseObject, SimpleFields, BasicField
 
         return True
 
+    def setObjectData(self):
+        """
+        Execute Fields Update with Buffered Writes & Translations
+
+        On failure, valid fields changes are still written, as fields
+        setters would have done without buffering.
+        """
+        from odoo.addons.splashsync.helpers import TransHelper, WritesBuffer
+        self.prefetch()
+        WritesBuffer.buffer()
+        TransHelper.buffer()
+        if not super(OdooObject, self).setObjectData():
+            WritesBuffer.flush()
+            TransHelper.flush()
+            return False
+
+        return True
+
+    # ====================================================================#
+    # Simple Fields Writers, Buffered until Object Update
+    # ====================================================================#
+
+    def setSimple(self, field_id, field_data, target=None):
+        """Write Simple Raw Field"""
+        self.set_simple_value(field_id, field_data, target)
+
+    def setSimpleBool(self, field_id, field_data, target=None):
+        """Write Simple Bool Field"""
+        if not isinstance(field_data, bool) and field_data == "0":
+            field_data = False
+        self.set_simple_value(field_id, bool(field_data), target)
+
+    def setSimpleDate(self, field_id, field_data, target=None):
+        """Write Simple Date Field"""
+        if field_data is None:
+            return self.set_simple_value(field_id, None, target)
+        try:
+            field_date = datetime.strptime(field_data, const.__SPL_T_DATECAST__).date()
+        except Exception as exception:
+            return Framework.log().fromException(exception)
+        self.set_simple_value(field_id, field_date, target)
+
+    def setSimpleDateTime(self, field_id, field_data, target=None):
+        """Write Simple DateTime Field"""
+        if field_data is None:
+            return self.set_simple_value(field_id, None, target)
+        try:
+            field_date = datetime.strptime(field_data, const.__SPL_T_DATETIMECAST__)
+        except ValueError:
+            return Framework.log().error("Invalid DateTime: " + field_data)
+        except Exception as exception:
+            return Framework.log().fromException(exception)
+        self.set_simple_value(field_id, field_date, target)
+
+    def set_simple_value(self, field_id, field_data, target=None):
+        """
+        Write Simple Raw Field Value, Buffered until Object Update
+        :param field_id: str
+        :param field_data: mixed
+        :param target: None, Odoo Record
+        :return: void
+        """
+        from odoo.addons.splashsync.helpers import WritesBuffer
+        try:
+            # ====================================================================#
+            # Only set if attribute value has changed
+            WritesBuffer.set(target if target is not None else self.object, field_id, field_data)
+            # ====================================================================#
+            # Mark Field as Processed
+            self._in.__delitem__(field_id)
+        except Exception as exception:
+            return Framework.log().fromException(exception)
+
+    def prefetch(self):
+        """Prefetch Data Needed to Read/Write Loaded Object"""
+        from odoo.addons.splashsync.helpers import FilesDownloader, TransHelper
+        TransHelper.reset_cache()
+        FilesDownloader.reset()
+
     def getObjectIdentifier(self):
         return self.object.id
 
@@ -121,11 +218,46 @@ class OdooObject(ListsHelper, BinaryFields, BaseObject, SimpleFields, BasicField
 
     def fields(self):
         """Override Fields Definition if Configurator Defined"""
-        fields = super(BaseObject, self).fields()
-        if self.configurator is None:
+        # ====================================================================#
+        # Load Fields Definition from Persisted Cache
+        from odoo.addons.splashsync.helpers import SettingsManager
+        cache = http.request.env['splash.fields.cache']
+        company_id = SettingsManager.get_company_id()
+        version = self.get_fields_version()
+        fields = cache.load(self.getType(), company_id, version)
+        if isinstance(fields, list):
             return fields
+        # ====================================================================#
+        # Build Fields Definition
+        fields = super(BaseObject, self).fields()
+        if self.configurator is not None:
+            fields = self.configurator.overrideFields(self.getType(), fields)
+        # ====================================================================#
+        # Store Fields Definition in Persisted Cache
+        if isinstance(fields, list):
+            cache.store(self.getType(), company_id, version, fields)
+
+        return fields
+
+    def get_fields_version(self):
+        """
+        Build Fields Definition Version Hash from Modules, Languages & Settings
+
+        Installed modules & active languages are loaded once per registry,
+        so no query is done on each Describe.
+
+        :return: str
+        """
+        from odoo.addons.splashsync.helpers import SettingsManager, SchemaHelper
+        env = self.getModel().env
 
-        return self.configurator.overrideFields(self.getType(), fields)
+        return hashlib.md5(json.dumps([
+            self.getType(),
+            SchemaHelper.get_signature(env),
+            SchemaHelper.get_languages(env),
+            SettingsManager.get_objects_configuration(),
+            Framework.isDebugMode(),
+        ], sort_keys=True, default=str).encode()).hexdigest()
 
     # ====================================================================#
     # OBJECT DEBUG
@@ -86,6 +86,13 @@ class Product(
             "write_date": {"group": "Meta", "itemtype": "http://schema.org/DataFeedItem", "itemprop": "dateModified"},
         }
 
+    def reset(self):
+        """Forget Request Dependent Data before Object Reuse"""
+        super(Product, self).reset()
+        self.template = None
+        self.images_list = None
+        self.features_map = None
+
     def order_inputs(self):
         """Ensure Inputs are Correctly Ordered"""
         from collections import OrderedDict
@@ -155,6 +162,32 @@ class Product(
 
         return model
 
+    def prefetch(self):
+        """Reset Product Request Caches & Prefetch Translations in a Single Query per Model"""
+        super(Product, self).prefetch()
+        self.images_list = None
+        self.features_map = None
+        from odoo.addons.splashsync.helpers import TransHelper, SettingsManager
+        if not len(TransHelper.get_extra_iso()) or self.template is None:
+            return
+        # ====================================================================#
+        # Template Translated Fields
+        TransHelper.prefetch(self.template, [
+            field_id for field_id, field in self.get_basic_fields_list().items()
+            if field["type"] in ['char', 'text'] and field.get("translate") is True
+        ])
+        # ====================================================================#
+        # Attributes & Features Values Names
+        values = self.object.attribute_value_ids | self.template.valid_product_attribute_value_ids
+        if SettingsManager.is_prd_adv_variants():
+            values |= self.object.features_value_ids
+        TransHelper.prefetch(values, ['name'])
+
+    def is_deferred_binary(self, field_id):
+        """Products Images are Downloaded in Background if Enabled"""
+        from odoo.addons.splashsync.helpers import SettingsManager
+        return SettingsManager.is_prd_deferred_images()
+
     def debug( self, product, template):
         """Debug for Product Attributes Configuration"""
         # Debug Product Variants
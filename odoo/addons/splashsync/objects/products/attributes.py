@@ -17,6 +17,7 @@ from splashpy import const, Framework
 from splashpy.componants import FieldFactory
 from splashpy.helpers import ListHelper
 from odoo.addons.splashsync.helpers import AttributesHelper, LinesHelper, TransHelper, ValuesHelper, SettingsManager
+from odoo.addons.splashsync.helpers import WritesBuffer
 
 
 class ProductsAttributes:
@@ -127,8 +128,8 @@ class ProductsAttributes:
         for attr_value in to_delete_values:
             # Remove Attribute from Values
             self.object.attribute_value_ids = [(3, attr_value.id, 0)]
-            # Update Template Attribute Values with Variants Values
-            self._set_variants_value_ids(attr_value.attribute_id)
+            # Remove Value from Template Attribute Line if Not Used Anymore
+            LinesHelper.remove_value(self.template, attr_value)
         self._in.__delitem__(field_id)
 
     def _get_attributes_values(self, value_id):
@@ -189,6 +190,7 @@ class ProductsAttributes:
         # ====================================================================#
         # If Values are Similar => Nothing to Do => Exit
         if len(current_value) == 1 and new_value.id == current_value.id:
+            WritesBuffer.count("skipped")
             return
         # ====================================================================#
         # Update Attribute Value => Remove Old Value => Add New Value
@@ -197,8 +199,10 @@ class ProductsAttributes:
         else:
             self.object.attribute_value_ids = [(4, new_value.id, 0)]
         # ====================================================================#
-        # Update Template Attribute Values with Variants Values
-        self._set_variants_value_ids(new_value.attribute_id)
+        # Update Template Attribute Line from Changed Values Only
+        LinesHelper.add_value(self.template, new_value)
+        for old_value in current_value:
+            LinesHelper.remove_value(self.template, old_value)
 
     def _set_attribute_extra_price(self, attr_id, value):
         """
@@ -225,6 +229,7 @@ class ProductsAttributes:
                 continue
             # Compare Values
             if abs(attr_value.price_extra - extra_price) < 1e-03:
+                WritesBuffer.count("skipped")
                 continue
             # Update Value
             attr_value.price_extra = extra_price
@@ -240,21 +245,3 @@ class ProductsAttributes:
             iso_field_id = "value_" + iso_code
             if iso_field_id in field_values.keys():
                 TransHelper.set(attr_value, 'name', iso_code, field_values[iso_field_id])
-
-    def _set_variants_value_ids(self, attribute, active_test=True):
-        """
-        Get List of Product Value Ids for product Variants
-        :param attribute: product.attribute
-        :param active_test: bool
-        :return: list
-        """
-        # ====================================================================#
-        # Collect Variants Product Values Ids
-        values_ids = []
-        for variant in self.template.with_context(active_test=active_test).product_variant_ids:
-            for value in variant.attribute_value_ids.filtered(lambda v: v.attribute_id.id == attribute.id):
-                values_ids += [value.id]
-        # ====================================================================#
-        # Update Product Template Attribute Values Ids
-        LinesHelper.set(self.template, attribute, values_ids)
-        return values_ids
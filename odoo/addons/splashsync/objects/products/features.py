@@ -15,7 +15,7 @@
 from odoo import http
 from splashpy import const, Framework
 from splashpy.componants import FieldFactory
-from odoo.addons.splashsync.helpers import AttributesHelper, LinesHelper, ValuesHelper, SettingsManager
+from odoo.addons.splashsync.helpers import AttributesHelper, LinesHelper, ValuesHelper, SettingsManager, WritesBuffer
 
 
 class ProductsFeatures:
@@ -26,6 +26,9 @@ class ProductsFeatures:
     # Static Prefix for Feature Attributes
     prefix = "__feature_id__"
 
+    # Loaded Product Features Map, Built Once per Request
+    features_map = None
+
     def buildFeaturesFields(self):
         from odoo.addons.splashsync.helpers import TransHelper
         # ====================================================================#
@@ -68,27 +71,12 @@ class ProductsFeatures:
         self._in.__delitem__(index)
         self._out[field_id] = None
         # ==================================================================== #
-        # Check if Product has Attribute Value
-        for attr_value in self.object.attribute_value_ids:
-            if attr_value.attribute_id.id == attr_id:
-                self._out[field_id] = attr_value.name
-                self.__getFeatureTranslatedFields(field_id, attr_value)
-                return
-        # ==================================================================== #
-        # Check if Product has Advanced Feature Value
-        if SettingsManager.is_prd_adv_variants():
-            for attr_value in self.object.features_value_ids:
-                if attr_value.attribute_id.id == attr_id:
-                    self._out[field_id] = attr_value.name
-                    self.__getFeatureTranslatedFields(field_id, attr_value)
-                    return
-        # ==================================================================== #
-        # Check if Product has Feature Value
-        for attr_value in self.template.valid_product_attribute_value_ids:
-            if attr_value.attribute_id.id == attr_id:
-                self._out[field_id] = attr_value.name
-                self.__getFeatureTranslatedFields(field_id, attr_value)
-                return
+        # Check if Product has Attribute, Advanced Feature or Feature Value
+        attr_value = self.get_features_map()["values"].get(attr_id)
+        if attr_value is not None:
+            self._out[field_id] = attr_value.name
+            self.__getFeatureTranslatedFields(field_id, attr_value)
+            return
         # ==================================================================== #
         # Complete Not Found Feature Translations
         self.__isEmptyFeatureTranslatedFields(field_id)
@@ -108,9 +96,7 @@ class ProductsFeatures:
         self._in.__delitem__(field_id)
         # ==================================================================== #
         # Check if Product has Feature Value
-        attr_lines = self.template.attribute_line_ids.filtered(
-            lambda l: l.attribute_id.create_variant == "no_variant" and l.attribute_id.id == attr_id
-        )
+        attr_lines = self.get_features_map()["lines"].get(attr_id, [])
         for attr_line in attr_lines:
             # ==================================================================== #
             # Find or Create Attribute Value
@@ -119,12 +105,15 @@ class ProductsFeatures:
             # Empty Value or Creation Fail => Remove Product Attribute
             if new_value is None:
                 self.template.attribute_line_ids = [(3, attr_line.id, 0)]
+                self.features_map["lines"][attr_id] = []
                 self.__isEmptyFeatureTranslatedFields(field_id)
                 return
             # ====================================================================#
             # If Values are Different => Update Values
             if len(attr_line.value_ids) != 1 or new_value.id != attr_line.value_ids[0].id:
                 attr_line.value_ids = [(6, 0, [new_value.id])]
+            else:
+                WritesBuffer.count("skipped")
             # ====================================================================#
             # Update Product Attribute Translations
             self.__setFeatureTranslatedFields(field_id, new_value)
@@ -135,6 +124,9 @@ class ProductsFeatures:
             # Find or Create Attribute Value
             new_value = ValuesHelper.touch(AttributesHelper.load(attr_id), str(field_data), True)
             LinesHelper.add(self.template, new_value)
+            self.features_map["lines"][attr_id] = self.template.attribute_line_ids.filtered(
+                lambda l: l.attribute_id.id == attr_id
+            )
             self.__setFeatureTranslatedFields(field_id, new_value)
         # ==================================================================== #
         # Complete Empty Feature Translations
@@ -156,13 +148,14 @@ class ProductsFeatures:
         self._in.__delitem__(field_id)
         # ====================================================================#
         # Find Product Current Feature Values
-        current = self.object.features_value_ids.filtered(lambda v: v.attribute_id.id == attr_id)
+        current = self.get_features_map()["features"].get(attr_id, self.object.features_value_ids.browse())
         # ==================================================================== #
         # Empty Product Feature Value
         if field_data is None or len(str(field_data)) == 0:
             if len(current):
                 # Remove Product Feature
                 self.object.features_value_ids = [(3, current.id, 0)]
+                self.features_map["features"].pop(attr_id, None)
             # Update Translations
             self.__isEmptyFeatureTranslatedFields(field_id)
             return
@@ -175,6 +168,7 @@ class ProductsFeatures:
         # ====================================================================#
         # If Values are Similar => Nothing to Do => Exit
         if len(current) == 1 and new_value.id == current.id:
+            WritesBuffer.count("skipped")
             self.__setFeatureTranslatedFields(field_id, new_value)
             return
         # ====================================================================#
@@ -183,10 +177,68 @@ class ProductsFeatures:
             self.object.features_value_ids = [(3, current.id, 0), (4, new_value.id, 0)]
         else:
             self.object.features_value_ids = [(4, new_value.id, 0)]
+        self.features_map["features"][attr_id] = new_value
         # ====================================================================#
         # Update Translations
         self.__setFeatureTranslatedFields(field_id, new_value)
 
+    # ====================================================================#
+    # Products Features Map
+    # ====================================================================#
+
+    def get_features_map(self):
+        """
+        Get Loaded Product Features Map, Built Once per Request
+
+            - values:   attribute id => value read for feature field (product values first,
+                        then advanced features values, then template values)
+            - features: attribute id => advanced feature value
+            - lines:    attribute id => template features attribute lines
+            - requested: requested field id => index, built on first use in read mode
+
+        :return: dict
+        """
+        if self.features_map is not None:
+            return self.features_map
+        self.features_map = {"values": {}, "features": {}, "lines": {}, "requested": None}
+        # ==================================================================== #
+        # Read Values, Lowest Priority First => First Value of Each Collection Wins
+        collections = [self.template.valid_product_attribute_value_ids]
+        if SettingsManager.is_prd_adv_variants():
+            collections += [self.object.features_value_ids]
+        collections += [self.object.attribute_value_ids]
+        for collection in collections:
+            for attr_value in reversed(collection):
+                self.features_map["values"][attr_value.attribute_id.id] = attr_value
+        # ==================================================================== #
+        # Advanced Features Values
+        for attr_value in reversed(self.object.features_value_ids):
+            self.features_map["features"][attr_value.attribute_id.id] = attr_value
+        # ==================================================================== #
+        # Template Features Lines
+        for attr_line in self.template.attribute_line_ids:
+            if attr_line.attribute_id.create_variant != "no_variant":
+                continue
+            lines = self.features_map["lines"].get(attr_line.attribute_id.id, attr_line.browse())
+            self.features_map["lines"][attr_line.attribute_id.id] = lines | attr_line
+
+        return self.features_map
+
+    def get_requested_features(self):
+        """
+        Get Requested Fields Indexes, Read Mode Only
+        :return: dict   field id => index
+        """
+        if self.mode != "get":
+            return {}
+        features_map = self.get_features_map()
+        if features_map["requested"] is None:
+            features_map["requested"] = {
+                field_id: index for index, field_id in self._in.items() if isinstance(field_id, str)
+            }
+
+        return features_map["requested"]
+
     # ====================================================================#
     # Products Feature Field Ids Management
     # ====================================================================#
@@ -230,13 +282,14 @@ class ProductsFeatures:
 
     def __getFeatureTranslatedFields(self, field_id, attr_value):
         from odoo.addons.splashsync.helpers import TransHelper
+        requested = self.get_requested_features()
         for iso_code in TransHelper.get_extra_iso():
             iso_field_id = field_id+"_"+iso_code
-            for key, val in self._in.copy().items():
-                if iso_field_id != val:
-                    continue
-                self._out[iso_field_id] = TransHelper.get(attr_value, 'name', iso_code, attr_value.name)
-                self._in.__delitem__(key)
+            key = requested.get(iso_field_id)
+            if key is None or key not in self._in or self._in[key] != iso_field_id:
+                continue
+            self._out[iso_field_id] = TransHelper.get(attr_value, 'name', iso_code, attr_value.name)
+            self._in.__delitem__(key)
 
     def __setFeatureTranslatedFields(self, field_id, attr_value):
         from odoo.addons.splashsync.helpers import TransHelper
@@ -252,11 +305,11 @@ class ProductsFeatures:
         for iso_code in TransHelper.get_extra_iso():
             iso_field_id = field_id+"_"+iso_code
             # Read Mode
-            for key, val in self._in.copy().items():
-                if iso_field_id != val:
-                    continue
-                self._out[iso_field_id] = ""
-                self._in.__delitem__(key)
+            if self.mode == "get":
+                key = self.get_requested_features().get(iso_field_id)
+                if key is not None and key in self._in and self._in[key] == iso_field_id:
+                    self._out[iso_field_id] = ""
+                    self._in.__delitem__(key)
             # Write Mode
-            if iso_field_id in self._in.keys():
+            elif iso_field_id in self._in.keys():
                 self._in.__delitem__(iso_field_id)
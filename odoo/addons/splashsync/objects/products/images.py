@@ -16,7 +16,7 @@ from collections import OrderedDict
 from splashpy import const, Framework
 from splashpy.componants import FieldFactory
 from splashpy.helpers import ListHelper
-from odoo.addons.splashsync.helpers import ProductImagesHelper
+from odoo.addons.splashsync.helpers import FilesDownloader, OddoFilesHelper, ProductImagesHelper
 
 
 class ProductsImages:
@@ -24,6 +24,9 @@ class ProductsImages:
     Access to product Images Fields
     """
 
+    # Product Images List, Built Once per Request
+    images_list = None
+
     @staticmethod
     def buildImagesFields():
         # ==================================================================== #
@@ -67,10 +70,13 @@ class ProductsImages:
         if value_id is None:
             return
         # ==================================================================== #
-        # Get Product Attributes Data
-        img_values = ProductImagesHelper.get_values(self.object, value_id)
-        for pos in range(len(img_values)):
-            ListHelper.insert(self._out, "Images", field_id, "img-"+str(pos), img_values[pos])
+        # Build Product Images List Once per Request
+        if self.images_list is None:
+            self.images_list = ProductImagesHelper.get_list(self.object)
+        # ==================================================================== #
+        # Get Product Images Data
+        for pos in range(len(self.images_list)):
+            ListHelper.insert(self._out, "Images", field_id, "img-"+str(pos), self.images_list[pos][value_id])
         # # ==================================================================== #
         # # Force Attributes Ordering
         self._out["Images"] = OrderedDict(sorted(self._out["Images"].items()))
@@ -89,17 +95,20 @@ class ProductsImages:
         # ====================================================================#
         # Sort Images List by Positions
         field_data = ProductImagesHelper.sort_images(field_data)
+        # ====================================================================#
+        # Download All New Images in Parallel
+        self._prefetch_images(field_data)
 
         # ====================================================================#
         # Update Main Image
         main_index, main_image = ProductImagesHelper.find_cover(field_data)
         self._in["image"] = main_image
-        self.set_binary_data("image", self._in["image"], self.template)
+        self.set_binary_data("image", self._in["image"], self.template, main_index or 0)
 
         # ====================================================================#
         # Update Variant Image
         variant_index, self._in["image_variant"] = ProductImagesHelper.find_variant(field_data)
-        self.set_binary_data("image_variant", self._in["image_variant"], self.object)
+        self.set_binary_data("image_variant", self._in["image_variant"], self.object, variant_index or 0)
 
         # ====================================================================#
         # Fetch Current Product Images
@@ -133,7 +142,7 @@ class ProductsImages:
                 # ====================================================================#
                 # Update Image Contents
                 self._in["image"] = spl_image["image"]
-                self.set_binary_data("image", spl_image["image"], product_image)
+                self.set_binary_data("image", spl_image["image"], product_image, index)
                 # Update loop metadata
                 index_images += 1
                 product_image_ids += [product_image.id]
@@ -143,3 +152,28 @@ class ProductsImages:
         self.template.product_image_ids = [(6, 0, product_image_ids)]
 
         self._in.__delitem__("Images")
+
+    def _prefetch_images(self, images_list):
+        """
+        Download in Parallel Received Images not Already on Product
+        :param images_list: dict
+        :return: void
+        """
+        if not isinstance(images_list, dict) or self.is_deferred_binary("image"):
+            return
+        # ====================================================================#
+        # Collect Current Product Images Md5
+        local_md5 = []
+        for image in ProductImagesHelper.get_list(self.object):
+            if isinstance(image["image"], dict):
+                local_md5 += [image["image"]["md5"]]
+        # ====================================================================#
+        # Collect Images Already Stored by Other Records
+        received = [
+            spl_image["image"] for spl_image in images_list.values()
+            if isinstance(spl_image.get("image"), dict) and spl_image["image"].get("md5")
+        ]
+        local_md5 += list(OddoFilesHelper.getIndexModel().find_by_md5([image["md5"] for image in received]).keys())
+        # ====================================================================#
+        # Download Missing Images
+        FilesDownloader.prefetch([image for image in received if image["md5"] not in local_md5])
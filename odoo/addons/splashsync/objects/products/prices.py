@@ -17,6 +17,7 @@ from splashpy.componants import FieldFactory
 from splashpy.helpers import PricesHelper
 from odoo.addons.splashsync.models.configuration import ResConfigSettings
 from odoo.addons.splashsync.helpers import CurrencyHelper, TaxHelper, SettingsManager, M2MHelper, AttributesHelper
+from odoo.addons.splashsync.helpers import WritesBuffer
 
 
 class ProductsPrices:
@@ -179,9 +180,9 @@ class ProductsPrices:
                 if tax is None:
                     return Framework.log().error("Unable to Identify Tax ID for Rate "+str(tax_rate))
                 else:
-                    self.object.taxes_id = [(6, 0, [tax.id])]
+                    WritesBuffer.set(self.object, "taxes_id", [(6, 0, [tax.id])])
             else:
-                self.object.taxes_id = [(6, 0, [])]
+                WritesBuffer.set(self.object, "taxes_id", [(6, 0, [])])
         # ==================================================================== #
         # Update Product Buy Taxes
         if field_id == "standard_price":
@@ -191,9 +192,9 @@ class ProductsPrices:
                 if tax is None:
                     return Framework.log().error("Unable to Identify Tax ID for Rate "+str(tax_rate))
                 else:
-                    self.object.supplier_taxes_id = [(6, 0, [tax.id])]
+                    WritesBuffer.set(self.object, "supplier_taxes_id", [(6, 0, [tax.id])])
             else:
-                self.object.supplier_taxes_id = [(6, 0, [])]
+                WritesBuffer.set(self.object, "supplier_taxes_id", [(6, 0, [])])
 
     def setPricesTaxFields(self, field_id, field_data):
         # Check if Price Field...
@@ -251,7 +252,7 @@ class ProductsPrices:
         """
         self._in.__delitem__("variant_price")
         if abs(tax_excl) < 1e-3:
-            self.object.variant_price_extra = 0
+            WritesBuffer.set(self.object, "variant_price_extra", 0)
             return
         # ==================================================================== #
         # Detect Potential Base Price on Inputs
@@ -262,9 +263,11 @@ class ProductsPrices:
                 list_price = float(PricesHelper.taxExcluded((self._in["list_price"])))
             except TypeError:
                 list_price = 0
-            self.object.variant_price_extra = tax_excl - list_price
+            WritesBuffer.set(self.object, "variant_price_extra", tax_excl - list_price)
         else:
-            self.object.variant_price_extra = tax_excl - self.object.list_price
+            WritesBuffer.set(
+                self.object, "variant_price_extra", tax_excl - WritesBuffer.get(self.object, "list_price")
+            )
 
     def _set_final_price(self, tax_excl):
         """
@@ -277,19 +280,22 @@ class ProductsPrices:
         # ==================================================================== #
         # For Simple Products
         if self.object.product_variant_count == 1:
-            self.object.list_price = tax_excl
-            self.object.variant_price_extra = 0
+            WritesBuffer.set(self.object, "list_price", tax_excl)
+            WritesBuffer.set(self.object, "variant_price_extra", 0)
         # ==================================================================== #
         # For Variant Products with Simple Prices
         elif SettingsManager.is_prd_simple_prices():
             # ==================================================================== #
             # Detect Base Price on Inputs
             if "list_price" in self._in:
-                self.object.variant_price_extra = tax_excl - PricesHelper.taxExcluded((self._in["list_price"]))
+                list_price = PricesHelper.taxExcluded((self._in["list_price"]))
+                WritesBuffer.set(self.object, "variant_price_extra", tax_excl - list_price)
             else:
-                self.object.variant_price_extra = tax_excl - self.object.list_price
+                WritesBuffer.set(
+                    self.object, "variant_price_extra", tax_excl - WritesBuffer.get(self.object, "list_price")
+                )
         # ==================================================================== #
         # For Variant Products without Simple Prices
         else:
-            self.object.list_price = tax_excl - self.object.price_extra
+            WritesBuffer.set(self.object, "list_price", tax_excl - self.object.price_extra)
         self._in.__delitem__("lst_price")
@@ -14,7 +14,7 @@
 
 from splashpy import const, Framework
 from splashpy.componants import FieldFactory
-from odoo.addons.splashsync.helpers import M2MHelper, M2OHelper
+from odoo.addons.splashsync.helpers import M2MHelper, M2OHelper, SchemaHelper
 
 
 class ProductsRelations:
@@ -42,7 +42,7 @@ class ProductsRelations:
         FieldFactory.isNotTested()
         # ==================================================================== #
         # Website category
-        if "public_categ_ids" in self.getModel().fields_get():
+        if SchemaHelper.has_field(self.getModel(), "public_categ_ids"):
             FieldFactory.create(const.__SPL_T_VARCHAR__, "public_categ_ids", "Categorie Id")
             FieldFactory.microData("http://schema.org/Product", "publicCategoryId")
             FieldFactory.isReadOnly()
@@ -52,19 +52,19 @@ class ProductsRelations:
             FieldFactory.isNotTested()
         # ==================================================================== #
         # Website Alternate Products
-        if "alternative_product_ids" in self.getModel().fields_get():
+        if SchemaHelper.has_field(self.getModel(), "alternative_product_ids"):
             FieldFactory.create(const.__SPL_T_VARCHAR__, "alternative_products", "Alternate Products Names")
             FieldFactory.microData("http://schema.org/Product", "alternateModels")
             FieldFactory.isNotTested()
         # ==================================================================== #
         # Website Accessory Products
-        if "accessory_product_ids" in self.getModel().fields_get():
+        if SchemaHelper.has_field(self.getModel(), "accessory_product_ids"):
             FieldFactory.create(const.__SPL_T_VARCHAR__, "accessory_products", "Accessory Products Names")
             FieldFactory.microData("http://schema.org/Product", "crossellModels")
             FieldFactory.isNotTested()
         # ==================================================================== #
         # Allowed Companies
-        if "ons_allowed_company_ids" in self.getModel().fields_get():
+        if SchemaHelper.has_field(self.getModel(), "ons_allowed_company_ids"):
             FieldFactory.create(const.__SPL_T_VARCHAR__, "company_ids", "Companies IDs")
             FieldFactory.microData("http://schema.org/Product", "allowedCompanies")
             FieldFactory.isNotTested()
@@ -73,7 +73,7 @@ class ProductsRelations:
             FieldFactory.isNotTested()
         # ==================================================================== #
         # Product Brand
-        if "product_brand_id" in self.getModel().fields_get():
+        if SchemaHelper.has_field(self.getModel(), "product_brand_id"):
             FieldFactory.create(const.__SPL_T_VARCHAR__, "product_brand_id", "Brand Id")
             FieldFactory.microData("http://schema.org/Product", "brandId")
             FieldFactory.isReadOnly()
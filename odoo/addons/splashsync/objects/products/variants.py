@@ -116,7 +116,8 @@ class ProductsVariants:
         if "variants" not in self._in.keys() or not isinstance(self._in["variants"], dict):
             return None
         # ====================================================================#
-        # Walk on Variants Items
+        # Walk on Variants Items => Collect Products Ids
+        product_ids = []
         for key, variant in self._in["variants"].items():
             # Variant Object Splash Id is Here
             if "id" not in variant.keys() or not isinstance(variant["id"], str):
@@ -125,12 +126,15 @@ class ProductsVariants:
             product_id = ObjectsHelper.id(variant["id"])
             if not isinstance(product_id, str) or int(product_id) <= 0:
                 continue
-            # Load Variant Product
-            product = self.load(int(product_id))
-            if product is False or not isinstance(product.product_tmpl_id[0].id, int):
-                continue
-            # Return product Template Id
-            return product.product_tmpl_id[0].id
+            product_ids += [int(product_id)]
+        # ====================================================================#
+        # Load All Variants Products at Once
+        products = self.getModel().browse(product_ids).exists()
+        for product_id in product_ids:
+            product = products.filtered(lambda p: p.id == product_id)
+            if len(product) == 1 and isinstance(product.product_tmpl_id[0].id, int):
+                # Return product Template Id
+                return product.product_tmpl_id[0].id
 
         return None
 
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+from odoo.tests.common import TransactionCase, tagged
+from odoo.addons.splashsync.helpers import CacheManager
+
+
+@tagged('post_install', '-at_install')
+class TestCacheManager(TransactionCase):
+    """Splash Per Worker Caches Versions"""
+
+    def test_version_changed_by_hooks(self):
+        version = CacheManager.get_version(self.env, ["product.category"])
+        self.assertEqual(version, CacheManager.get_version(self.env, ["product.category"]))
+        category = self.env['product.category'].create({'name': "Splash Cache Category"})
+        created = CacheManager.get_version(self.env, ["product.category"])
+        self.assertNotEqual(version, created)
+        category.unlink()
+        self.assertNotEqual(created, CacheManager.get_version(self.env, ["product.category"]))
+
+    def test_version_read_once_per_transaction(self):
+        version = CacheManager.get_version(self.env, ["product.category"])
+        self.env.cr.execute(
+            "INSERT INTO product_category (name, write_date) VALUES ('Splash SQL Category', now() at time zone 'UTC')"
+        )
+        self.assertEqual(version, CacheManager.get_version(self.env, ["product.category"]))
+        CacheManager.notify(self.env['product.category'])
+        self.assertNotEqual(version, CacheManager.get_version(self.env, ["product.category"]))
+
+    def test_version_forgotten_on_rollback(self):
+        self.env.cr.rollback()
+        version = CacheManager.get_version(self.env, ["product.category"])
+        self.env['product.category'].create({'name': "Splash Rolled Back Category"})
+        self.assertNotEqual(version, CacheManager.get_version(self.env, ["product.category"]))
+        self.env.cr.rollback()
+        self.assertEqual(version, CacheManager.get_version(self.env, ["product.category"]))
+
+    def test_unknown_model_version(self):
+        self.assertEqual((None, ), CacheManager.get_version(self.env, ["splash.unknown.model"]))
+
+    def test_store_drops_outdated_versions(self):
+        cache = {("db", 1, "v1"): "old", ("db", 2, "v1"): "other"}
+        self.assertEqual("new", CacheManager.store(cache, ("db", 1, "v2"), "new"))
+        self.assertEqual({("db", 1, "v2"): "new", ("db", 2, "v1"): "other"}, cache)
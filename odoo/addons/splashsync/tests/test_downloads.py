@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.request import urlopen
+from unittest.mock import patch
+from odoo.tests.common import TransactionCase, tagged
+from odoo.addons.splashsync.helpers import FilesDownloader, FrameworkHelper
+
+
+class FilesHandler(BaseHTTPRequestHandler):
+    """Serve Test Files, Counting Requests by Path"""
+
+    files = {}
+    requests = []
+
+    def do_GET(self):
+        FilesHandler.requests.append(self.path)
+        if self.path not in FilesHandler.files:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(FilesHandler.files[self.path])
+
+    def log_message(self, *args):
+        pass
+
+
+@tagged('post_install', '-at_install')
+class TestFilesDownloader(TransactionCase):
+    """Splash Files Parallel Downloads"""
+
+    @classmethod
+    def setUpClass(cls):
+        super(TestFilesDownloader, cls).setUpClass()
+        cls.server = HTTPServer(("127.0.0.1", 0), FilesHandler)
+        cls.url = "http://127.0.0.1:" + str(cls.server.server_port)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super(TestFilesDownloader, cls).tearDownClass()
+
+    def setUp(self):
+        super(TestFilesDownloader, self).setUp()
+        FilesHandler.files = {
+            "/" + str(index): ("Splash File " + str(index)).encode() for index in range(6)
+        }
+        FilesHandler.requests = []
+        FilesDownloader.reset()
+
+    def fetcher(self, path, md5):
+        """Download a File from Test Server"""
+        raw = urlopen(self.url + path, timeout=5).read()
+        if hashlib.md5(raw).hexdigest() != md5:
+            return None
+        return {"path": path, "md5": md5, "raw": raw}
+
+    @staticmethod
+    def file_data(path, contents=None):
+        contents = FilesHandler.files.get(path, b"") if contents is None else contents
+        return {"file": path, "path": path, "md5": hashlib.md5(contents).hexdigest()}
+
+    def test_prefetch_files(self):
+        files = [self.file_data("/" + str(index)) for index in range(6)]
+        FilesDownloader.prefetch(files, self.fetcher, max_workers=3)
+        self.assertEqual(6, len(FilesHandler.requests))
+        for file_data in files:
+            new_file = FilesDownloader.get(file_data, self.fail)
+            self.assertEqual(file_data["path"], new_file["path"])
+            self.assertEqual(FilesHandler.files[file_data["path"]], new_file["raw"])
+
+    def test_prefetch_order(self):
+        files = [self.file_data("/" + str(index)) for index in [3, 1, 5, 0]]
+        FilesDownloader.prefetch(files, self.fetcher, max_workers=4)
+        self.assertEqual(
+            [file_data["md5"] for file_data in files],
+            list(FilesDownloader.get_files().keys())
+        )
+
+    def test_prefetch_dedup(self):
+        files = [self.file_data("/1"), self.file_data("/2"), self.file_data("/1"), "NotAFile", {"file": "/3"}]
+        FilesDownloader.prefetch(files, self.fetcher)
+        self.assertEqual(["/1", "/2"], sorted(FilesHandler.requests))
+
+    def test_prefetch_errors(self):
+        files = [self.file_data("/1"), self.file_data("/missing", b"missing"), self.file_data("/2", b"wrong")]
+        FilesDownloader.prefetch(files, self.fetcher)
+        # Valid File Downloaded
+        self.assertEqual(FilesHandler.files["/1"], FilesDownloader.get(files[0], self.fail)["raw"])
+        # Http Error => Not Prefetched
+        self.assertNotIn(files[1]["md5"], FilesDownloader.get_files())
+        # Wrong Md5 => Stored as Missing & Downloaded Again on Get
+        self.assertIsNone(FilesDownloader.get_files()[files[2]["md5"]])
+        self.assertIsNone(FilesDownloader.get(files[2], self.fetcher))
+        self.assertEqual(2, FilesHandler.requests.count("/2"))
+
+    def test_decode_response(self):
+        self.assertIsNone(FilesDownloader.decode_response(False))
+        self.assertIsNone(FilesDownloader.decode_response({"result": "0"}))
+        self.assertIsNone(FilesDownloader.decode_response({"result": "1", "tasks": {}}))
+        self.assertEqual({"md5": "x"}, FilesDownloader.decode_response(
+            {"result": "1", "tasks": {"task": {"data": {"md5": "x"}}}}
+        ))
+
+    def test_default_fetcher_connection(self):
+        connection = {"id": "ThisIsSplashWsId", "key": "ThisIsYourEncryptionKeyForSplash", "host": self.url}
+        sent = []
+
+        def send(used_connection, service, request):
+            sent.append((threading.current_thread(), used_connection, service))
+            return {"result": "1", "tasks": {"task": {"data": {"md5": request["tasks"]["task"]["params"]["md5"]}}}}
+
+        files = [self.file_data("/1"), self.file_data("/2")]
+        with patch.object(FrameworkHelper, "get_connection", return_value=connection) as get_connection:
+            with patch.object(FrameworkHelper, "send", side_effect=send):
+                FilesDownloader.prefetch(files, max_workers=2)
+        # Connection Resolved Once, in Calling Thread
+        self.assertEqual(1, get_connection.call_count)
+        self.assertEqual(2, len(sent))
+        for thread, used_connection, service in sent:
+            self.assertIsNot(threading.current_thread(), thread)
+            self.assertEqual(connection, used_connection)
+            self.assertEqual("Files", service)
+        for file_data in files:
+            self.assertEqual(file_data["md5"], FilesDownloader.get(file_data, self.fail)["md5"])
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+from odoo.tests.common import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestFamilyCreation(TransactionCase):
+    """Products Family Bulk Creation API"""
+
+    def setUp(self):
+        super(TestFamilyCreation, self).setUp()
+        self.color = self.env['product.attribute'].create({
+            "name": "Splash Family Color", "type": "select", "create_variant": "always"
+        })
+        self.red = self.env['product.attribute.value'].create({"name": "Red", "attribute_id": self.color.id})
+
+    def find_attributes(self, name):
+        return self.env['product.attribute'].search([('name', '=ilike', name)])
+
+    def test_family_created_at_once(self):
+        variants = self.env['product.template'].splash_create_family({"name": "Splash Family"}, [
+            {"default_code": "FAM-RED-S", "attributes": {"SPLASH FAMILY COLOR": "red", "Splash Family Size": "S"}},
+            {"default_code": "FAM-BLUE-S", "attributes": {"splash family color": "Blue", "Splash Family Size": "s"}},
+            {"default_code": "FAM-BLUE-M", "attributes": {"Splash Family Color": "BLUE", "splash family size": "M"}},
+        ])
+        # ====================================================================#
+        # One Template with All Variants
+        template = variants.mapped('product_tmpl_id')
+        self.assertEqual(3, len(variants))
+        self.assertEqual(1, len(template))
+        self.assertEqual(set(variants.ids), set(template.product_variant_ids.ids))
+        # ====================================================================#
+        # Existing Attribute & Value Reused, Missing Ones Created Once
+        self.assertEqual(self.color, self.find_attributes("splash family color"))
+        size = self.find_attributes("splash family size")
+        self.assertEqual(1, len(size))
+        self.assertEqual(2, len(self.color.value_ids))
+        self.assertEqual(2, len(size.value_ids))
+        red_variant = variants.filtered(lambda v: v.default_code == "FAM-RED-S")
+        self.assertIn(self.red, red_variant.attribute_value_ids)
+        # ====================================================================#
+        # One Attribute Line per Attribute, with Used Values
+        self.assertEqual(2, len(template.attribute_line_ids))
+        for line in template.attribute_line_ids:
+            self.assertIn(line.attribute_id, self.color | size)
+            self.assertEqual(line.attribute_id.value_ids, line.value_ids)
+        self.assertEqual(
+            set(variants.mapped('attribute_value_ids').ids),
+            set(template.attribute_line_ids.mapped('value_ids').ids)
+        )
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import threading
+from splashpy import Framework
+from odoo.tests.common import TransactionCase, tagged
+from odoo.addons.splashsync.helpers import FrameworkHelper, SettingsManager
+
+
+@tagged('post_install', '-at_install')
+class TestImageQueue(TransactionCase):
+    """Splash Deferred Images Queue"""
+
+    def setUp(self):
+        super(TestImageQueue, self).setUp()
+        self.job = self.env['splash.image.queue'].create({
+            'res_model': 'product.product',
+            'res_id': 1,
+            'res_field': 'image',
+            'md5': "ThisIsNotAnMd5",
+            'path': "ThisIsNotAPath",
+        })
+
+    def test_attempts_counted_in_database(self):
+        queue = self.env['splash.image.queue']
+        for attempt in range(1, queue.max_attempts):
+            queue._add_attempt(self.job, ValueError("Attempt " + str(attempt)))
+            self.assertEqual(attempt, self.job.attempts)
+            self.assertEqual("Attempt " + str(attempt), self.job.last_error)
+            self.assertEqual('pending', self.job.state)
+        queue._add_attempt(self.job, ValueError("Last Attempt"))
+        self.assertEqual(queue.max_attempts, self.job.attempts)
+        self.assertEqual('failed', self.job.state)
+
+    def test_attempts_ignore_cached_values(self):
+        self.job.attempts = 2
+        self.env.cr.execute("UPDATE splash_image_queue SET attempts = 0 WHERE id = %s", (self.job.id, ))
+        self.env['splash.image.queue']._add_attempt(self.job, ValueError("Failed"))
+        self.assertEqual(1, self.job.attempts)
+
+
+@tagged('post_install', '-at_install')
+class TestFrameworkBoot(TransactionCase):
+    """Splash Framework Boot for Scheduled Actions"""
+
+    def test_framework_state_unchanged(self):
+        config = Framework.config()
+        logger = Framework.log()
+        with FrameworkHelper.boot(self.env, 1) as connection:
+            self.assertIs(config, Framework.config())
+            self.assertEqual(SettingsManager.get_id(), connection["id"])
+            self.assertEqual(SettingsManager.get_key(), connection["key"])
+        self.assertIs(config, Framework.config())
+        self.assertIs(logger, Framework.log())
+        self.assertIsNone(getattr(SettingsManager.__local__, "settings", None))
+
+    def test_settings_reset_on_errors(self):
+        with self.assertRaises(ValueError):
+            with FrameworkHelper.boot(self.env, 1):
+                raise ValueError("Company Failed")
+        self.assertIsNone(getattr(SettingsManager.__local__, "settings", None))
+
+    def test_lock_not_held(self):
+        acquired = {}
+
+        def acquire_in_thread():
+            acquired["lock"] = FrameworkHelper.lock.acquire(timeout=5)
+            if acquired["lock"]:
+                FrameworkHelper.lock.release()
+
+        with FrameworkHelper.boot(self.env, 1):
+            thread = threading.Thread(target=acquire_in_thread)
+            thread.start()
+            thread.join()
+        self.assertTrue(acquired["lock"])
+
+    def test_settings_per_thread(self):
+        loaded = {}
+
+        def boot_in_thread():
+            loaded["settings"] = SettingsManager.boot(self.env, 1)
+
+        SettingsManager.reset()
+        thread = threading.Thread(target=boot_in_thread)
+        thread.start()
+        thread.join()
+        self.assertIsInstance(loaded["settings"], dict)
+        self.assertIsNone(getattr(SettingsManager.__local__, "settings", None))
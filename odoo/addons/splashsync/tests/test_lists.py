@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+from unittest.mock import patch
+from odoo.tests.common import TransactionCase, tagged
+from odoo.addons.splashsync.helpers import ListsHelper
+
+
+class FakeCursor:
+    """Cursor Collecting Post-Commit Handlers"""
+
+    dbname = "splash-tests"
+
+    def __init__(self):
+        self.handlers = {"commit": [], "rollback": []}
+
+    def after(self, event, func):
+        self.handlers[event].append(func)
+
+    def commit(self):
+        for func in self.handlers["commit"]:
+            func()
+        self.handlers = {"commit": [], "rollback": []}
+
+    def rollback(self):
+        self.handlers = {"commit": [], "rollback": []}
+
+
+@tagged('post_install', '-at_install')
+class TestListsCounts(TransactionCase):
+    """Splash Objects Lists Cached Counts"""
+
+    def setUp(self):
+        super(TestListsCounts, self).setUp()
+        self.key = (FakeCursor.dbname, "product.product")
+        ListsHelper.__counts__[self.key] = 10
+
+    def tearDown(self):
+        ListsHelper.__counts__.pop(self.key, None)
+        super(TestListsCounts, self).tearDown()
+
+    def test_count_applied_on_commit(self):
+        cr = FakeCursor()
+        ListsHelper.count_changed(cr, "product.product", 3)
+        self.assertEqual(ListsHelper.__counts__[self.key], 10)
+        cr.commit()
+        self.assertEqual(ListsHelper.__counts__[self.key], 13)
+
+    def test_count_dropped_on_rollback(self):
+        cr = FakeCursor()
+        ListsHelper.count_changed(cr, "product.product", -2)
+        cr.rollback()
+        cr.commit()
+        self.assertEqual(ListsHelper.__counts__[self.key], 10)
+
+    def test_count_never_negative(self):
+        cr = FakeCursor()
+        ListsHelper.count_changed(cr, "product.product", -50)
+        cr.commit()
+        self.assertEqual(ListsHelper.__counts__[self.key], 0)
+
+    def test_count_unknown_domain(self):
+        cr = FakeCursor()
+        ListsHelper.count_changed(cr, "product.template", 1)
+        cr.commit()
+        self.assertNotIn((FakeCursor.dbname, "product.template"), ListsHelper.__counts__)
+
+    def test_products_changes_deltas(self):
+        with patch.object(ListsHelper, "count_changed") as count_changed:
+            products = self.env['product.product'].create([
+                {'name': "Splash Active Product"},
+                {'name': "Splash Archived Product", 'active': False},
+            ])
+            self.assertEqual(count_changed.call_args[0][2], 1)
+            count_changed.reset_mock()
+            # Archive Active Product Only
+            products.write({'active': False})
+            self.assertEqual(count_changed.call_args[0][2], -1)
+            count_changed.reset_mock()
+            # Archive Again => No Changes
+            products.write({'active': False})
+            count_changed.assert_not_called()
+            # Unarchive Both Products
+            products.write({'active': True})
+            self.assertEqual(count_changed.call_args[0][2], 2)
+            count_changed.reset_mock()
+            products.unlink()
+            self.assertEqual(count_changed.call_args[0][2], -2)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+from datetime import timedelta
+from unittest.mock import patch
+from splashpy import Framework
+from odoo import fields
+from odoo.tests.common import TransactionCase, tagged
+from odoo.addons.splashsync.helpers import FrameworkHelper
+
+
+@tagged('post_install', '-at_install')
+class TestOutboxRegister(TransactionCase):
+    """Splash Changes Outbox Filling"""
+
+    def setUp(self):
+        super(TestOutboxRegister, self).setUp()
+        self.product = self.env['product.product'].create({"name": "Splash Outbox Product"})
+
+    def get_events(self, action):
+        return self.env['splash.outbox'].search([
+            ('res_model', '=', 'product.product'),
+            ('res_id', '=', self.product.id),
+            ('action', '=', action),
+        ])
+
+    def test_created_products_registered(self):
+        self.assertEqual(1, len(self.get_events('create')))
+
+    def test_changed_fields_registered(self):
+        self.product.write({"default_code": "SPLASH-OUTBOX", "message_main_attachment_id": False})
+        events = self.get_events('update')
+        self.assertEqual(1, len(events))
+        self.assertEqual("default_code", events.changed_fields)
+
+    def test_technical_fields_not_registered(self):
+        self.product.write({"message_main_attachment_id": False})
+        self.product.product_tmpl_id.write({"message_main_attachment_id": False})
+        self.assertFalse(self.get_events('update'))
+
+    def test_template_changes_registered_for_variants(self):
+        self.product.product_tmpl_id.write({"name": "Splash Outbox Template"})
+        events = self.get_events('update')
+        self.assertEqual(1, len(events))
+        self.assertEqual("name", events.changed_fields)
+
+    def test_no_commit_context(self):
+        self.product.with_context(splash_no_commit=True).write({"default_code": "SPLASH-OUTBOX"})
+        self.product.product_tmpl_id.splash_repair_attribute_lines()
+        self.assertFalse(self.get_events('update'))
+
+
+@tagged('post_install', '-at_install')
+class TestOutboxDispatch(TransactionCase):
+    """Splash Changes Outbox Coalescing"""
+
+    def setUp(self):
+        super(TestOutboxDispatch, self).setUp()
+        self.outbox = self.env['splash.outbox']
+        self.outbox.search([]).unlink()
+        self.company_id = 999
+
+    def add_event(self, res_id, action, age):
+        return self.outbox.create({
+            'res_model': 'product.product',
+            'res_id': res_id,
+            'action': action,
+            'company_id': self.company_id,
+            'date': fields.Datetime.now() - timedelta(seconds=age),
+        })
+
+    def test_merge_actions(self):
+        self.assertEqual('update', self.outbox.merge_actions(['update', 'update']))
+        self.assertEqual('create', self.outbox.merge_actions(['create', 'update']))
+        self.assertEqual('delete', self.outbox.merge_actions(['update', 'delete']))
+        self.assertIsNone(self.outbox.merge_actions(['create', 'update', 'delete']))
+
+    def test_ready_events_selection(self):
+        # Quiet for a full window => Ready
+        quiet = self.add_event(1, 'update', 120) | self.add_event(1, 'update', 90)
+        # Still changed => Waiting
+        self.add_event(2, 'update', 90)
+        self.add_event(2, 'update', 10)
+        # Continuously changed for max windows => Ready, with all its changes
+        continuous = self.add_event(3, 'update', 400) | self.add_event(3, 'update', 5)
+        # Another company => Ignored
+        self.outbox.create({'res_model': 'product.product', 'res_id': 4, 'action': 'update', 'company_id': 1})
+        events = self.outbox._get_ready_events(self.company_id, 60, 100)
+        self.assertEqual(set((quiet | continuous).ids), set(events.ids))
+        self.assertEqual(1, len(self.outbox._get_ready_events(self.company_id, 60, 1).mapped('res_id')))
+        self.assertEqual(6, len(self.outbox._get_ready_events(self.company_id, 0, 100)))
+
+    def test_attempts_counted_in_database(self):
+        events = self.add_event(1, 'update', 0) | self.add_event(2, 'update', 0)
+        for attempt in range(1, self.outbox.max_attempts + 1):
+            self.outbox._add_attempt(events, ValueError("Attempt " + str(attempt)))
+        self.assertEqual([self.outbox.max_attempts] * 2, events.mapped('attempts'))
+        self.assertEqual(['failed'] * 2, events.mapped('state'))
+
+    def test_stats_stored_by_company(self):
+        stats = {"events": 3, "merged": 2, "dropped": 0, "objects": 1, "commits": 1}
+        before = self.outbox.get_stats()
+        self.outbox._add_stats(self.company_id, stats)
+        self.outbox._add_stats(self.company_id, stats)
+        self.outbox._add_stats(self.company_id, dict(stats, events=0))
+        self.assertEqual({key: value * 2 for key, value in stats.items()}, self.outbox.get_stats(self.company_id))
+        self.assertEqual(before["events"] + 6, self.outbox.get_stats()["events"])
+
+    def test_dispatch_in_server_mode(self):
+        events = self.add_event(1, 'update', 120) | self.add_event(2, 'create', 120) | self.add_event(2, 'update', 90)
+        commits = []
+
+        def send(connection, service, request):
+            commits.append(request["tasks"]["task"]["params"])
+            return {"result": "1"}
+
+        # Server Mode Left by a Webservice Request
+        Framework.setServerMode(True)
+        self.addCleanup(Framework.setServerMode, False)
+        with patch.object(self.env.cr, "commit"), patch.object(FrameworkHelper, "send", side_effect=send):
+            with FrameworkHelper.boot(self.env, 1):
+                self.outbox._dispatch(events, self.company_id)
+        self.assertFalse(events.exists())
+        self.assertEqual(
+            [("Product", ["1"], "update"), ("Product", ["2"], "create")],
+            sorted([(params["type"], params["id"], params["action"]) for params in commits], key=lambda c: c[1])
+        )
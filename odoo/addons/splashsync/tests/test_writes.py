@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+#
+#  This file is part of SplashSync Project.
+#
+#  Copyright (C) 2015-2020 Splash Sync  <www.splashsync.com>
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+#  For the full copyright and license information, please view the LICENSE
+#  file that was distributed with this source code.
+#
+
+import threading
+from unittest.mock import patch
+from odoo.tests.common import TransactionCase, tagged
+from odoo.addons.splashsync.helpers import WritesBuffer
+
+
+@tagged('post_install', '-at_install')
+class TestWritesBuffer(TransactionCase):
+    """Splash Buffered Fields Writes"""
+
+    def setUp(self):
+        super(TestWritesBuffer, self).setUp()
+        self.product = self.env['product.product'].create({
+            'name': "Splash Buffered Product",
+            'default_code': "SPLASH-BUFFER",
+            'list_price': 10.0,
+        })
+
+    def tearDown(self):
+        WritesBuffer.reset()
+        super(TestWritesBuffer, self).tearDown()
+
+    def test_direct_writes(self):
+        self.assertTrue(WritesBuffer.set(self.product, "name", "Splash Direct Product"))
+        self.assertEqual("Splash Direct Product", self.product.name)
+
+    def test_single_write_per_record(self):
+        WritesBuffer.buffer()
+        WritesBuffer.set(self.product, "name", "Splash New Name")
+        WritesBuffer.set(self.product, "default_code", "SPLASH-NEW")
+        WritesBuffer.set(self.product, "list_price", 12.5)
+        self.assertEqual("Splash Buffered Product", self.product.name)
+        self.assertEqual("Splash New Name", WritesBuffer.get(self.product, "name"))
+        with patch.object(type(self.product), "write", autospec=True, side_effect=type(self.product).write) as write:
+            self.assertTrue(WritesBuffer.flush())
+            self.assertEqual(1, write.call_count)
+        self.assertEqual("Splash New Name", self.product.name)
+        self.assertEqual("SPLASH-NEW", self.product.default_code)
+        self.assertEqual(12.5, self.product.list_price)
+        self.assertIsNone(WritesBuffer.get_pending())
+
+    def test_unchanged_values_skipped(self):
+        WritesBuffer.buffer()
+        self.assertFalse(WritesBuffer.set(self.product, "name", "Splash Buffered Product"))
+        self.assertFalse(WritesBuffer.set(self.product, "list_price", "10.00"))
+        self.assertTrue(WritesBuffer.set(self.product, "default_code", "SPLASH-CHANGED"))
+        self.assertEqual({"written": 1, "skipped": 2}, WritesBuffer.get_stats())
+        self.assertEqual({"default_code": "SPLASH-CHANGED"}, WritesBuffer.get_vals(self.product))
+
+    def test_counters_only_while_buffering(self):
+        WritesBuffer.reset()
+        WritesBuffer.set(self.product, "name", "Splash Direct Product")
+        WritesBuffer.count("skipped")
+        self.assertEqual({"written": 0, "skipped": 0}, WritesBuffer.get_stats())
+        WritesBuffer.buffer()
+        WritesBuffer.set(self.product, "name", "Splash Buffered Name")
+        WritesBuffer.flush()
+        WritesBuffer.count("skipped")
+        self.assertEqual({"written": 1, "skipped": 1}, WritesBuffer.get_stats())
+        WritesBuffer.buffer()
+        self.assertEqual({"written": 0, "skipped": 0}, WritesBuffer.get_stats())
+
+    def test_binary_compared_by_md5(self):
+        template = self.product.product_tmpl_id
+        image = b"R0lGODlhAQABAIAAAP///wAAACH5BAEAAAAALAAAAAABAAEAAAICRAEAOw=="
+        self.assertFalse(WritesBuffer.is_changed(template, "image", None))
+        self.assertTrue(WritesBuffer.is_changed(template, "image", image))
+        template.image = image
+        self.env['splash.binary.index'].update_metadata(template, "image", image)
+        self.assertFalse(WritesBuffer.is_changed(template, "image", image))
+        self.assertTrue(WritesBuffer.is_changed(template, "image", False))
+
+    def test_relational_commands_merged(self):
+        self.assertEqual({1, 3}, WritesBuffer.apply_commands([1, 2], [(3, 2, 0), (4, 3, 0)]))
+        self.assertEqual({5}, WritesBuffer.apply_commands([1, 2], [(6, 0, [5])]))
+        self.assertEqual(set(), WritesBuffer.apply_commands([1, 2], [(5, 0, 0)]))
+        self.assertIsNone(WritesBuffer.apply_commands([1, 2], [(0, 0, {"name": "New"})]))
+
+    def test_buffers_per_thread(self):
+        WritesBuffer.buffer()
+        WritesBuffer.set(self.product, "name", "Splash Main Thread")
+        seen = {}
+
+        def other_request():
+            seen["pending"] = WritesBuffer.get_pending()
+            WritesBuffer.buffer()
+            WritesBuffer.reset()
+
+        thread = threading.Thread(target=other_request)
+        thread.start()
+        thread.join()
+        self.assertIsNone(seen["pending"])
+        self.assertEqual({"name": "Splash Main Thread"}, WritesBuffer.get_vals(self.product))